@@ -0,0 +1,100 @@
+"""
+I.N.S.I.G.H.T. Briefing Output Helpers
+Shared Console, HTML, and JSON output generation for the briefing workflow tests.
+
+HTML and JSON are rendered concurrently in worker threads; console output stays
+on the main thread to preserve stdout ordering. Output modules are imported on
+first use so runs that fail during setup never load them.
+"""
+
+import asyncio
+import logging
+from collections import defaultdict
+from pathlib import Path
+from typing import List, Dict, Any
+
+
+def render_html(posts_by_source: Dict[str, List[Dict[str, Any]]], html_filename: str, title: str) -> str:
+    """Render the briefing as HTML and save it (runs in a worker thread)."""
+    from output.html_output import HTMLOutput
+
+    html_output = HTMLOutput(title)
+    html_output.render_briefing(posts_by_source, days=3)
+    html_output.save_to_file(html_filename)
+    return html_filename
+
+
+def render_json(posts: List[Dict[str, Any]], json_filename: str, mission_name: str, sources: List[str]) -> str:
+    """Export the briefing posts as JSON (runs in a worker thread)."""
+    from output.json_output import JSONOutput
+
+    json_output = JSONOutput()
+
+    # Create mission summary
+    mission_context = json_output.create_mission_summary(posts, mission_name, sources)
+
+    json_output.export_to_file(posts, json_filename, mission_context=mission_context)
+    return json_filename
+
+
+async def generate_briefing_outputs(posts: List[Dict[str, Any]], output_stem: Path, console_title: str,
+                                    html_title: str, mission_name: str, test_results: Dict[str, Any],
+                                    logger: logging.Logger) -> Dict[str, str]:
+    """
+    Generate outputs in Console, HTML, and JSON formats.
+
+    Args:
+        posts: Briefing posts in unified format
+        output_stem: Output path without suffix; .html and .json are appended
+        console_title: Heading for the console briefing
+        html_title: Title of the HTML page
+        mission_name: Mission name recorded in the JSON summary
+        test_results: Test results dict; formats generated and errors are appended to it
+        logger: Logger of the calling test
+
+    Returns:
+        Dictionary mapping format name to the saved file path
+    """
+    from output.console_output import ConsoleOutput
+
+    logger.info("📄 Generating outputs in multiple formats...")
+
+    output_files = {}
+
+    try:
+        # 1. Console Output (kept on the main thread to preserve stdout ordering)
+        logger.info("🖥️ Generating console output...")
+        ConsoleOutput.render_briefing_to_console(posts, console_title)
+        test_results["output_formats_generated"].append("console")
+
+        # Organize posts by source for HTML rendering
+        posts_by_source = defaultdict(list)
+        for post in posts:
+            posts_by_source[post.get('source', 'unknown')].append(post)
+
+        # 2. HTML and 3. JSON Output, written concurrently
+        logger.info("🌐 Generating HTML and 📋 JSON output...")
+        html_filename = str(output_stem.with_suffix(".html"))
+        json_filename = str(output_stem.with_suffix(".json"))
+
+        results = await asyncio.gather(
+            asyncio.to_thread(render_html, posts_by_source, html_filename, html_title),
+            asyncio.to_thread(render_json, posts, json_filename, mission_name, list(posts_by_source.keys())),
+            return_exceptions=True
+        )
+
+        for format_type, result in zip(("html", "json"), results):
+            if isinstance(result, Exception):
+                logger.error("❌ %s output failed: %s", format_type.upper(), result)
+                test_results["errors"].append(f"Output generation ({format_type}): {str(result)}")
+                continue
+
+            output_files[format_type] = result
+            test_results["output_formats_generated"].append(format_type)
+            logger.info("✅ %s saved: %s", format_type.upper(), result)
+
+    except Exception as e:
+        logger.error("❌ Output generation failed: %s", e)
+        test_results["errors"].append(f"Output generation: {str(e)}")
+
+    return output_files
@@ -13,19 +13,30 @@ This test script:
 import asyncio
 import sys
 import os
+import time
 from datetime import datetime, timezone, timedelta
+from operator import itemgetter
+from pathlib import Path
 from typing import List, Dict, Any
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from connectors.telegram_connector import TelegramConnector
+from connectors import get_shared_connector, release_shared_connector, release_shared_connectors
+from connectors.history_cache import HistoryCache
 from connectors.tool_registry import discover_tools, tool_registry
 from config.config_manager import ConfigManager
-from output.console_output import ConsoleOutput
-from output.html_output import HTMLOutput
-from output.json_output import JSONOutput
 from logs.core.logger_config import get_component_logger
+from briefing_outputs import generate_briefing_outputs
+
+# Directory the briefing test writes its HTML/JSON outputs to
+OUTPUT_DIR = Path("Tests/output")
+
+# Per-day Telegram history cache reused by test reruns
+CACHE_DIR = Path("Tests/cache/telegram")
+
+# How far back the individual fetch_posts fallback keeps posts
+BRIEFING_WINDOW = timedelta(days=5)
 
 class BriefingWorkflowTest:
     """
@@ -36,6 +47,9 @@ class BriefingWorkflowTest:
         self.logger = get_component_logger('briefing_test')
         self.config_manager = ConfigManager()
         self.telegram_connector = None
+        self.history_cache = None
+        self._telegram_channels = []
+        self._t0 = time.perf_counter()
         self.test_results = {
             "setup_success": False,
             "tools_discovered": 0,
@@ -51,6 +65,7 @@ class BriefingWorkflowTest:
         """Set up the test environment and validate everything is ready."""
         self.logger.info("🔧 Setting up briefing workflow test environment...")
         self.test_results["start_time"] = datetime.now()
+        self._t0 = time.perf_counter()
         
         try:
             # Load and validate config
@@ -61,7 +76,7 @@ class BriefingWorkflowTest:
             
             is_valid, validation_errors = self.config_manager.validate_config(config)
             if not is_valid:
-                self.logger.error(f"❌ Configuration validation failed: {validation_errors}")
+                self.logger.error("❌ Configuration validation failed: %s", validation_errors)
                 return False
             
             # Check if telegram is enabled
@@ -75,32 +90,33 @@ class BriefingWorkflowTest:
                 self.logger.error("❌ No telegram channels configured")
                 return False
             
-            self.logger.info(f"✅ Configuration loaded: {len(channels)} telegram channels found")
+            self._telegram_channels = channels
+            self.logger.info("✅ Configuration loaded: %s telegram channels found", len(channels))
             
-            # Setup telegram connector
-            self.telegram_connector = TelegramConnector()
+            # Setup and connect telegram connector (shared session across tests)
+            self.telegram_connector = await get_shared_connector('telegram')
             
-            if not self.telegram_connector.setup_connector():
+            if not self.telegram_connector:
                 self.logger.error("❌ Failed to setup telegram connector")
                 return False
             
-            # Connect to telegram
-            await self.telegram_connector.connect()
             self.logger.info("✅ Telegram connector connected successfully")
+            # Kept on the test rather than the shared connector, which other holders also use
+            self.history_cache = HistoryCache(str(CACHE_DIR))
             
             # Discover tools
             discovered_tools = discover_tools(self.telegram_connector)
             self.test_results["tools_discovered"] = len(discovered_tools)
             
-            self.logger.info(f"🔍 Discovered {len(discovered_tools)} tools:")
+            self.logger.info("🔍 Discovered %s tools:", len(discovered_tools))
             for tool in discovered_tools:
-                self.logger.info(f"   - {tool.name}: {tool.description}")
+                self.logger.info("   - %s: %s", tool.name, tool.description)
             
             self.test_results["setup_success"] = True
             return True
             
         except Exception as e:
-            self.logger.error(f"❌ Setup failed: {e}")
+            self.logger.error("❌ Setup failed: %s", e)
             self.test_results["errors"].append(f"Setup error: {str(e)}")
             return False
     
@@ -109,14 +125,12 @@ class BriefingWorkflowTest:
         self.logger.info("🔧 Testing individual telegram connector tools...")
         
         tool_test_results = {}
-        config = self.config_manager.get_config()
-        telegram_config = self.config_manager.get_platform_config(config, 'telegram')
-        channels = telegram_config.get('channels', [])
+        channels = self._telegram_channels
         
         # Test fetch_recent_posts tool
         if channels:
             test_channel = channels[0]  # Use first channel for individual test
-            self.logger.info(f"🧪 Testing fetch_recent_posts with channel: {test_channel}")
+            self.logger.info("🧪 Testing fetch_recent_posts with channel: %s", test_channel)
             
             try:
                 # Test with small limit first
@@ -129,7 +143,7 @@ class BriefingWorkflowTest:
                     "sample_post": recent_posts[0] if recent_posts else None
                 }
                 
-                self.logger.info(f"✅ fetch_recent_posts: {len(recent_posts)} posts from {test_channel}")
+                self.logger.info("✅ fetch_recent_posts: %s posts from %s", len(recent_posts), test_channel)
                 
             except Exception as e:
                 tool_test_results["fetch_recent_posts"] = {
@@ -137,7 +151,7 @@ class BriefingWorkflowTest:
                     "error": str(e),
                     "test_channel": test_channel
                 }
-                self.logger.error(f"❌ fetch_recent_posts failed: {e}")
+                self.logger.error("❌ fetch_recent_posts failed: %s", e)
         
         return tool_test_results
     
@@ -145,129 +159,85 @@ class BriefingWorkflowTest:
         """Run the main briefing workflow to get 4-day briefing."""
         self.logger.info("📋 Running 4-day briefing workflow...")
         
-        config = self.config_manager.get_config()
-        telegram_config = self.config_manager.get_platform_config(config, 'telegram')
-        channels = telegram_config.get('channels', [])
+        channels = self._telegram_channels
         
         self.test_results["channels_tested"] = len(channels)
         
         try:
             # Test get_briefing_posts method (if it exists)
             if hasattr(self.telegram_connector, 'get_briefing_posts'):
-                self.logger.info(f"🔍 Using get_briefing_posts for {len(channels)} channels")
+                self.logger.info("🔍 Using get_briefing_posts for %s channels", len(channels))
                 
                 # Get posts from last 3 days (today + 3 previous = 4 days total)
                 briefing_posts = await self.telegram_connector.get_briefing_posts(
                     channels=channels,
                     days=3,  # Last 3 days + today = 4 days total
-                    posts_per_channel=50  # Aim for ~40 total posts
+                    posts_per_channel=50,  # Aim for ~40 total posts
+                    history_cache=self.history_cache
                 )
                 
-                self.logger.info(f"✅ Briefing workflow: {len(briefing_posts)} posts collected")
+                self.logger.info("✅ Briefing workflow: %s posts collected", len(briefing_posts))
                 
             else:
                 # Fallback: collect individual posts from each channel
-                self.logger.info(f"🔍 Using individual fetch_posts for {len(channels)} channels")
+                self.logger.info("🔍 Using individual fetch_posts for %s channels", len(channels))
                 
                 all_posts = []
-                cutoff_date = datetime.now(timezone.utc) - timedelta(days=5)
-                
-                for channel in channels:
-                    try:
-                        # Fetch recent posts from each channel
-                        channel_posts = await self.telegram_connector.fetch_posts(channel, 50)
-                        
-                        # Filter to last 4 days
-                        filtered_posts = [
-                            post for post in channel_posts
-                            if post.get('date') and post['date'] >= cutoff_date
-                        ]
-                        
-                        all_posts.extend(filtered_posts)
-                        self.logger.info(f"   📡 {channel}: {len(filtered_posts)} posts from last 4 days")
-                        
-                    except Exception as e:
-                        self.logger.error(f"❌ Failed to fetch from {channel}: {e}")
-                        self.test_results["errors"].append(f"Channel {channel}: {str(e)}")
+                cutoff_ts = (datetime.now(timezone.utc) - BRIEFING_WINDOW).timestamp()
+
+                # Fetch recent posts from all channels concurrently
+                results = await asyncio.gather(
+                    *(self.telegram_connector.fetch_posts(channel, 50) for channel in channels),
+                    return_exceptions=True
+                )
+
+                for channel, channel_posts in zip(channels, results):
+                    if isinstance(channel_posts, Exception):
+                        self.logger.error("❌ Failed to fetch from %s: %s", channel, channel_posts)
+                        self.test_results["errors"].append(f"Channel {channel}: {str(channel_posts)}")
                         continue
+
+                    # Filter to last 4 days, keeping each post's timestamp alongside it
+                    dated_posts = [
+                        (post['date'].timestamp(), post) for post in channel_posts
+                        if post.get('date')
+                    ]
+                    filtered_posts = [entry for entry in dated_posts if entry[0] >= cutoff_ts]
+
+                    all_posts.extend(filtered_posts)
+                    self.logger.info("   📡 %s: %s posts from last 4 days", channel, len(filtered_posts))
                 
-                # Sort chronologically
-                briefing_posts = sorted(
-                    all_posts,
-                    key=lambda p: p.get('date', datetime.min.replace(tzinfo=timezone.utc))
-                )
+                # Sort chronologically on the pre-extracted timestamps
+                all_posts.sort(key=itemgetter(0))
+                briefing_posts = [post for _, post in all_posts]
                 
-                self.logger.info(f"✅ Individual workflow: {len(briefing_posts)} posts collected")
+                self.logger.info("✅ Individual workflow: %s posts collected", len(briefing_posts))
             
             self.test_results["total_posts_fetched"] = len(briefing_posts)
             return briefing_posts
             
         except Exception as e:
-            self.logger.error(f"❌ Briefing workflow failed: {e}")
+            self.logger.error("❌ Briefing workflow failed: %s", e)
             self.test_results["errors"].append(f"Briefing workflow: {str(e)}")
             return []
     
-    def generate_outputs(self, posts: List[Dict[str, Any]]) -> Dict[str, str]:
+    async def generate_outputs(self, posts: List[Dict[str, Any]]) -> Dict[str, str]:
         """Generate outputs in Console, HTML, and JSON formats."""
-        self.logger.info("📄 Generating outputs in multiple formats...")
-        
-        output_files = {}
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        
-        try:
-            # 1. Console Output
-            self.logger.info("🖥️ Generating console output...")
-            title = f"I.N.S.I.G.H.T. 4-Day Briefing Test ({len(posts)} posts)"
-            ConsoleOutput.render_briefing_to_console(posts, title)
-            self.test_results["output_formats_generated"].append("console")
-            
-            # 2. HTML Output
-            self.logger.info("🌐 Generating HTML output...")
-            html_output = HTMLOutput(f"I.N.S.I.G.H.T. Briefing Test - {timestamp}")
-            
-            # Organize posts by source for HTML rendering
-            posts_by_source = {}
-            for post in posts:
-                source = post.get('source', 'unknown')
-                if source not in posts_by_source:
-                    posts_by_source[source] = []
-                posts_by_source[source].append(post)
-            
-            html_output.render_briefing(posts_by_source, days=3)
-            html_filename = f"Tests/output/briefing_test_{timestamp}.html"
-            html_output.save_to_file(html_filename)
-            output_files["html"] = html_filename
-            self.test_results["output_formats_generated"].append("html")
-            self.logger.info(f"✅ HTML saved: {html_filename}")
-            
-            # 3. JSON Output
-            self.logger.info("📋 Generating JSON output...")
-            json_output = JSONOutput()
-            
-            # Create mission summary
-            channels = list(posts_by_source.keys())
-            mission_context = json_output.create_mission_summary(
-                posts, 
-                "4-Day Briefing Workflow Test", 
-                channels
-            )
-            
-            json_filename = f"Tests/output/briefing_test_{timestamp}.json"
-            json_output.export_to_file(posts, json_filename, mission_context=mission_context)
-            output_files["json"] = json_filename
-            self.test_results["output_formats_generated"].append("json")
-            self.logger.info(f"✅ JSON saved: {json_filename}")
-            
-        except Exception as e:
-            self.logger.error(f"❌ Output generation failed: {e}")
-            self.test_results["errors"].append(f"Output generation: {str(e)}")
-        
-        return output_files
+        return await generate_briefing_outputs(
+            posts,
+            OUTPUT_DIR / f"briefing_test_{timestamp}",
+            console_title=f"I.N.S.I.G.H.T. 4-Day Briefing Test ({len(posts)} posts)",
+            html_title=f"I.N.S.I.G.H.T. Briefing Test - {timestamp}",
+            mission_name="4-Day Briefing Workflow Test",
+            test_results=self.test_results,
+            logger=self.logger
+        )
     
     def generate_test_report(self, tool_results: Dict, output_files: Dict) -> None:
         """Generate comprehensive test report."""
         self.test_results["end_time"] = datetime.now()
-        duration = (self.test_results["end_time"] - self.test_results["start_time"]).total_seconds()
+        duration = time.perf_counter() - self._t0
         
         print("\n" + "="*60)
         print("🧪 I.N.S.I.G.H.T. BRIEFING WORKFLOW TEST REPORT")
@@ -321,17 +291,19 @@ class BriefingWorkflowTest:
         """Clean up test resources."""
         if self.telegram_connector:
             try:
-                await self.telegram_connector.disconnect()
-                self.logger.info("✅ Telegram connector disconnected")
+                # Release only this test's reference; the pooled session stays open for later runs
+                await release_shared_connector('telegram')
+                self.telegram_connector = None
+                self.logger.info("✅ Telegram connector released")
             except Exception as e:
-                self.logger.error(f"❌ Cleanup error: {e}")
+                self.logger.error("❌ Cleanup error: %s", e)
 
 async def main():
     """Main test execution function."""
     print("🚀 Starting I.N.S.I.G.H.T. Briefing Workflow Test...")
     
     # Create output directory if it doesn't exist
-    os.makedirs("Tests/output", exist_ok=True)
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     
     test = BriefingWorkflowTest()
     
@@ -352,7 +324,7 @@ async def main():
             return
         
         # Generate outputs in all formats
-        output_files = test.generate_outputs(briefing_posts)
+        output_files = await test.generate_outputs(briefing_posts)
         
         # Generate comprehensive test report
         test.generate_test_report(tool_results, output_files)
@@ -364,6 +336,8 @@ async def main():
     finally:
         # Cleanup
         await test.cleanup()
+        # Close pooled connector sessions once, at process exit
+        await release_shared_connectors()
 
 if __name__ == "__main__":
     # Run the test
@@ -17,48 +17,63 @@ class TestCases:
             'https://youtu.be/CQywdSdi5iA'
         ]
         self.reddit_subreddits = ['PixelArtTutorials', 'LocalLLaMA']
+        self._connector_index = None
     
-    def get_all_tests(self):
-        """Return all test cases"""
-        tests = []
-        
+    # Mission test builders in execution order
+    MISSION_BUILDERS = (
         # Mission 1: Telegram Deep Scan Tests
-        tests.extend(self._get_telegram_deep_scan_tests())
-        
+        '_get_telegram_deep_scan_tests',
         # Mission 2: Historical Briefing Tests
-        tests.extend(self._get_telegram_briefing_tests())
-        
+        '_get_telegram_briefing_tests',
         # Mission 3: End of Day Report Tests
-        tests.extend(self._get_telegram_eod_tests())
-        
+        '_get_telegram_eod_tests',
         # Mission 4: RSS Analysis Tests
-        tests.extend(self._get_rss_analysis_tests())
-        
+        '_get_rss_analysis_tests',
         # Mission 5: RSS Single Feed Tests
-        tests.extend(self._get_rss_single_tests())
-        
+        '_get_rss_single_tests',
         # Mission 6: RSS Multi-Feed Tests
-        tests.extend(self._get_rss_multi_tests())
-        
+        '_get_rss_multi_tests',
         # Mission 7: YouTube Transcript Tests
-        tests.extend(self._get_youtube_transcript_tests())
-        
+        '_get_youtube_transcript_tests',
         # Mission 8: YouTube Channel Tests
-        tests.extend(self._get_youtube_channel_tests())
-        
+        '_get_youtube_channel_tests',
         # Mission 9: YouTube Playlist Tests
-        tests.extend(self._get_youtube_playlist_tests())
-        
+        '_get_youtube_playlist_tests',
         # Mission 12: Reddit Post Tests
-        tests.extend(self._get_reddit_post_tests())
-        
+        '_get_reddit_post_tests',
         # Mission 13: Reddit Subreddit Tests
-        tests.extend(self._get_reddit_subreddit_tests())
-        
+        '_get_reddit_subreddit_tests',
         # Mission 14: Reddit Multi-Source Tests
-        tests.extend(self._get_reddit_multi_tests())
+        '_get_reddit_multi_tests',
+    )
+    
+    def get_all_tests(self):
+        """Yield all test cases, building each mission's tests only when reached"""
+        for builder in self.MISSION_BUILDERS:
+            yield from getattr(self, builder)()
+    
+    def _get_connector_index(self):
+        """Group all tests by their 'connectors_required' set (built once, then reused)"""
+        if self._connector_index is None:
+            index = {}
+            for test in self.get_all_tests():
+                index.setdefault(frozenset(test.get('connectors_required', [])), []).append(test)
+            self._connector_index = index
+        return self._connector_index
+    
+    def count_tests(self):
+        """Total number of test cases, taken from the cached connector index"""
+        return sum(len(tests) for tests in self._get_connector_index().values())
+    
+    def get_tests_for_connectors(self, available_connectors):
+        """Yield the tests whose required connectors are all available, grouped by connector set"""
+        available = frozenset(available_connectors)
         
-        return tests
+        for required, tests in self._get_connector_index().items():
+            if required <= available:
+                yield from tests
+            else:
+                print(f"⏭️  Skipping {len(tests)} tests - missing connectors: {sorted(required - available)}")
     
     def _get_telegram_deep_scan_tests(self):
         """Telegram Deep Scan test cases"""
@@ -255,17 +270,3 @@ class TestCases:
                 'connectors_required': ['reddit']
             }
         ]
-    
-    def filter_tests_by_connectors(self, tests, available_connectors):
-        """Filter tests based on available connectors"""
-        filtered_tests = []
-        
-        for test in tests:
-            required = test.get('connectors_required', [])
-            if all(connector in available_connectors for connector in required):
-                filtered_tests.append(test)
-            else:
-                missing = [c for c in required if c not in available_connectors]
-                print(f"⏭️  Skipping test '{test['name']}' - missing connectors: {missing}")
-        
-        return filtered_tests
\ No newline at end of file
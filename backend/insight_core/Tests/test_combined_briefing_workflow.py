@@ -12,9 +12,14 @@ This test script:
 """
 
 import asyncio
+import heapq
+import io
 import sys
 import os
+import time
 from datetime import datetime, timezone, timedelta
+from operator import itemgetter
+from pathlib import Path
 from typing import List, Dict, Any, Optional
 
 # Add parent directory to path for imports
@@ -22,12 +27,18 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from connectors.telegram_connector import TelegramConnector
 from connectors.rss_connector import RssConnector
+from connectors.feed_cache import FeedCache
 from connectors.tool_registry import discover_tools, tool_registry
 from config.config_manager import ConfigManager
-from output.console_output import ConsoleOutput
-from output.html_output import HTMLOutput
-from output.json_output import JSONOutput
 from logs.core.logger_config import get_component_logger
+from briefing_outputs import generate_briefing_outputs
+
+OUTPUT_DIR = Path("Tests/output")
+RSS_CACHE_DIR = Path("Tests/cache/rss")
+
+# Source tags added to every collected post; one shared str object per value
+TELEGRAM_CONNECTOR_TYPE, TELEGRAM_SOURCE_TYPE = 'telegram', 'telegram_channel'
+RSS_CONNECTOR_TYPE, RSS_SOURCE_TYPE = 'rss', 'rss_feed'
 
 class CombinedBriefingWorkflowTest:
     """
@@ -40,6 +51,14 @@ class CombinedBriefingWorkflowTest:
         self.config_manager = ConfigManager()
         self.telegram_connector = None
         self.rss_connector = None
+        self._t0 = time.perf_counter()
+        
+        # Platform config is static for the test run; cached once the config is loaded
+        self._telegram_config = {}
+        self._rss_config = {}
+        self._telegram_channels = ()
+        self._rss_feeds = ()
+        
         self.test_results = {
             "setup_success": False,
             "telegram_setup_success": False,
@@ -64,6 +83,7 @@ class CombinedBriefingWorkflowTest:
     async def setup_test_environment(self) -> bool:
         """Set up the test environment for both connectors and validate everything is ready."""
         self.logger.info("🔧 Setting up combined briefing workflow test environment...")
+        self._t0 = time.perf_counter()
         self.test_results["start_time"] = datetime.now()
         
         try:
@@ -75,15 +95,20 @@ class CombinedBriefingWorkflowTest:
             
             is_valid, validation_errors = self.config_manager.validate_config(config)
             if not is_valid:
-                self.logger.error(f"❌ Configuration validation failed: {validation_errors}")
+                self.logger.error("❌ Configuration validation failed: %s", validation_errors)
                 return False
             
-            # Setup Telegram connector
-            telegram_success = await self.setup_telegram_connector()
-            self.test_results["telegram_setup_success"] = telegram_success
+            self._telegram_config = self.config_manager.get_platform_config(config, 'telegram') or {}
+            self._rss_config = self.config_manager.get_platform_config(config, 'rss') or {}
+            self._telegram_channels = tuple(self._telegram_config.get('channels', []))
+            self._rss_feeds = tuple(self._rss_config.get('feeds', []))
             
-            # Setup RSS connector
-            rss_success = await self.setup_rss_connector()
+            # Setup Telegram and RSS connectors concurrently (disjoint services)
+            telegram_success, rss_success = await asyncio.gather(
+                self.setup_telegram_connector(),
+                self.setup_rss_connector()
+            )
+            self.test_results["telegram_setup_success"] = telegram_success
             self.test_results["rss_setup_success"] = rss_success
             
             # Overall setup success if at least one connector works
@@ -104,7 +129,7 @@ class CombinedBriefingWorkflowTest:
             return True
             
         except Exception as e:
-            self.logger.error(f"❌ Setup failed: {e}")
+            self.logger.error("❌ Setup failed: %s", e)
             self.test_results["errors"].append(f"Setup error: {str(e)}")
             return False
     
@@ -113,19 +138,16 @@ class CombinedBriefingWorkflowTest:
         try:
             self.logger.info("🔧 Setting up Telegram connector...")
             
-            config = self.config_manager.get_config()
-            telegram_config = self.config_manager.get_platform_config(config, 'telegram')
-            
-            if not telegram_config or not telegram_config.get('enabled', False):
+            if not self._telegram_config.get('enabled', False):
                 self.logger.warning("⚠️ Telegram is not enabled in configuration")
                 return False
             
-            channels = telegram_config.get('channels', [])
+            channels = self._telegram_channels
             if not channels:
                 self.logger.warning("⚠️ No telegram channels configured")
                 return False
             
-            self.logger.info(f"📡 Found {len(channels)} telegram channels in config")
+            self.logger.info("📡 Found %s telegram channels in config", len(channels))
             
             # Setup telegram connector
             self.telegram_connector = TelegramConnector()
@@ -141,14 +163,14 @@ class CombinedBriefingWorkflowTest:
             telegram_tools = discover_tools(self.telegram_connector)
             self.test_results["telegram_tools_discovered"] = len(telegram_tools)
             
-            self.logger.info(f"✅ Telegram connector ready: {len(telegram_tools)} tools discovered")
+            self.logger.info("✅ Telegram connector ready: %s tools discovered", len(telegram_tools))
             for tool in telegram_tools:
-                self.logger.info(f"   - {tool.name}: {tool.description}")
+                self.logger.info("   - %s: %s", tool.name, tool.description)
             
             return True
             
         except Exception as e:
-            self.logger.warning(f"⚠️ Telegram setup failed: {e}")
+            self.logger.warning("⚠️ Telegram setup failed: %s", e)
             self.test_results["errors"].append(f"Telegram setup: {str(e)}")
             return False
     
@@ -157,19 +179,16 @@ class CombinedBriefingWorkflowTest:
         try:
             self.logger.info("🔧 Setting up RSS connector...")
             
-            config = self.config_manager.get_config()
-            rss_config = self.config_manager.get_platform_config(config, 'rss')
-            
-            if not rss_config or not rss_config.get('enabled', False):
+            if not self._rss_config.get('enabled', False):
                 self.logger.warning("⚠️ RSS is not enabled in configuration")
                 return False
             
-            feeds = rss_config.get('feeds', [])
+            feeds = self._rss_feeds
             if not feeds:
                 self.logger.warning("⚠️ No RSS feeds configured")
                 return False
             
-            self.logger.info(f"📡 Found {len(feeds)} RSS feeds in config")
+            self.logger.info("📡 Found %s RSS feeds in config", len(feeds))
             
             # Setup RSS connector
             self.rss_connector = RssConnector()
@@ -178,6 +197,9 @@ class CombinedBriefingWorkflowTest:
                 self.logger.warning("⚠️ Failed to setup RSS connector")
                 return False
             
+            # Revalidate feeds with ETag/Last-Modified instead of re-downloading them every run
+            self.rss_connector.feed_cache = FeedCache(str(RSS_CACHE_DIR))
+            
             # Connect to RSS
             await self.rss_connector.connect()
             
@@ -185,14 +207,14 @@ class CombinedBriefingWorkflowTest:
             rss_tools = discover_tools(self.rss_connector)
             self.test_results["rss_tools_discovered"] = len(rss_tools)
             
-            self.logger.info(f"✅ RSS connector ready: {len(rss_tools)} tools discovered")
+            self.logger.info("✅ RSS connector ready: %s tools discovered", len(rss_tools))
             for tool in rss_tools:
-                self.logger.info(f"   - {tool.name}: {tool.description}")
+                self.logger.info("   - %s: %s", tool.name, tool.description)
             
             return True
             
         except Exception as e:
-            self.logger.warning(f"⚠️ RSS setup failed: {e}")
+            self.logger.warning("⚠️ RSS setup failed: %s", e)
             self.test_results["errors"].append(f"RSS setup: {str(e)}")
             return False
     
@@ -224,13 +246,11 @@ class CombinedBriefingWorkflowTest:
         self.logger.info("🧪 Testing Telegram connector methods...")
         
         telegram_results = {}
-        config = self.config_manager.get_config()
-        telegram_config = self.config_manager.get_platform_config(config, 'telegram')
-        channels = telegram_config.get('channels', [])
+        channels = self._telegram_channels
         
         if channels:
             test_channel = channels[0]
-            self.logger.info(f"🧪 Testing fetch_posts with channel: {test_channel}")
+            self.logger.info("🧪 Testing fetch_posts with channel: %s", test_channel)
             
             try:
                 recent_posts = await self.telegram_connector.fetch_posts(test_channel, 3)
@@ -242,7 +262,7 @@ class CombinedBriefingWorkflowTest:
                     "sample_post": recent_posts[0] if recent_posts else None
                 }
                 
-                self.logger.info(f"✅ Telegram fetch_posts: {len(recent_posts)} posts from {test_channel}")
+                self.logger.info("✅ Telegram fetch_posts: %s posts from %s", len(recent_posts), test_channel)
                 
             except Exception as e:
                 telegram_results["fetch_posts"] = {
@@ -250,7 +270,7 @@ class CombinedBriefingWorkflowTest:
                     "error": str(e),
                     "test_channel": test_channel
                 }
-                self.logger.error(f"❌ Telegram fetch_posts failed: {e}")
+                self.logger.error("❌ Telegram fetch_posts failed: %s", e)
         
         return telegram_results
     
@@ -259,13 +279,11 @@ class CombinedBriefingWorkflowTest:
         self.logger.info("🧪 Testing RSS connector methods...")
         
         rss_results = {}
-        config = self.config_manager.get_config()
-        rss_config = self.config_manager.get_platform_config(config, 'rss')
-        feeds = rss_config.get('feeds', [])
+        feeds = self._rss_feeds
         
         if feeds:
             test_feed = feeds[0]
-            self.logger.info(f"🧪 Testing get_feed_info with feed: {test_feed}")
+            self.logger.info("🧪 Testing get_feed_info with feed: %s", test_feed)
             
             try:
                 feed_info = await self.rss_connector.get_feed_info(test_feed)
@@ -277,7 +295,7 @@ class CombinedBriefingWorkflowTest:
                     "total_entries": feed_info.get('total_entries', 0)
                 }
                 
-                self.logger.info(f"✅ RSS get_feed_info: {feed_info.get('total_entries', 0)} entries in {test_feed}")
+                self.logger.info("✅ RSS get_feed_info: %s entries in %s", feed_info.get('total_entries', 0), test_feed)
                 
             except Exception as e:
                 rss_results["get_feed_info"] = {
@@ -285,10 +303,10 @@ class CombinedBriefingWorkflowTest:
                     "error": str(e),
                     "test_feed": test_feed
                 }
-                self.logger.error(f"❌ RSS get_feed_info failed: {e}")
+                self.logger.error("❌ RSS get_feed_info failed: %s", e)
             
             # Test fetch_posts
-            self.logger.info(f"🧪 Testing RSS fetch_posts with feed: {test_feed}")
+            self.logger.info("🧪 Testing RSS fetch_posts with feed: %s", test_feed)
             
             try:
                 recent_posts = await self.rss_connector.fetch_posts(test_feed, 3)
@@ -300,7 +318,7 @@ class CombinedBriefingWorkflowTest:
                     "sample_post": recent_posts[0] if recent_posts else None
                 }
                 
-                self.logger.info(f"✅ RSS fetch_posts: {len(recent_posts)} posts from {test_feed}")
+                self.logger.info("✅ RSS fetch_posts: %s posts from %s", len(recent_posts), test_feed)
                 
             except Exception as e:
                 rss_results["fetch_posts"] = {
@@ -308,7 +326,7 @@ class CombinedBriefingWorkflowTest:
                     "error": str(e),
                     "test_feed": test_feed
                 }
-                self.logger.error(f"❌ RSS fetch_posts failed: {e}")
+                self.logger.error("❌ RSS fetch_posts failed: %s", e)
         
         return rss_results
     
@@ -316,227 +334,205 @@ class CombinedBriefingWorkflowTest:
         """Run the main combined briefing workflow to get 4-day briefing from both sources."""
         self.logger.info("📋 Running 4-day combined briefing workflow...")
         
-        all_posts = []
         cutoff_date = datetime.now(timezone.utc) - timedelta(days=4)
         
-        # Collect posts from Telegram
+        async def _empty():
+            return []
+        
+        # Collect posts from Telegram and RSS concurrently
+        telegram_task = self.collect_telegram_posts(cutoff_date) if self.telegram_connector else _empty()
+        rss_task = self.collect_rss_posts(cutoff_date) if self.rss_connector else _empty()
+        telegram_posts, rss_posts = await asyncio.gather(telegram_task, rss_task)
+        
         if self.telegram_connector:
-            telegram_posts = await self.collect_telegram_posts(cutoff_date)
-            all_posts.extend(telegram_posts)
             self.test_results["telegram_posts_fetched"] = len(telegram_posts)
-            self.logger.info(f"📡 Telegram: {len(telegram_posts)} posts collected")
+            self.logger.info("📡 Telegram: %s posts collected", len(telegram_posts))
         else:
             self.logger.info("⚠️ Skipping Telegram collection (connector not available)")
         
-        # Collect posts from RSS
         if self.rss_connector:
-            rss_posts = await self.collect_rss_posts(cutoff_date)
-            all_posts.extend(rss_posts)
             self.test_results["rss_posts_fetched"] = len(rss_posts)
-            self.logger.info(f"📡 RSS: {len(rss_posts)} posts collected")
+            self.logger.info("📡 RSS: %s posts collected", len(rss_posts))
         else:
             self.logger.info("⚠️ Skipping RSS collection (connector not available)")
         
-        # Sort all posts by date in descending order (most recent first)
-        combined_posts = sorted(
-            all_posts,
-            key=lambda p: p.get('date', datetime.min.replace(tzinfo=timezone.utc)),
+        # Merge the per-platform timelines (each already sorted newest first)
+        combined_posts = list(heapq.merge(
+            telegram_posts,
+            rss_posts,
+            key=itemgetter('date'),
             reverse=True  # Descending order - most recent first
-        )
+        ))
         
         self.test_results["total_posts_fetched"] = len(combined_posts)
         
-        self.logger.info(f"✅ Combined workflow: {len(combined_posts)} total posts collected and sorted by date (descending)")
+        self.logger.info("✅ Combined workflow: %s total posts collected and sorted by date (descending)", len(combined_posts))
         
         return combined_posts
     
     async def collect_telegram_posts(self, cutoff_date: datetime) -> List[Dict[str, Any]]:
         """Collect posts from all Telegram channels."""
         telegram_posts = []
-        
-        config = self.config_manager.get_config()
-        telegram_config = self.config_manager.get_platform_config(config, 'telegram')
-        channels = telegram_config.get('channels', [])
+        channels = self._telegram_channels
         
         self.test_results["telegram_channels_tested"] = len(channels)
         
-        for channel in channels:
+        async def _one(channel):
             try:
-                self.logger.info(f"📡 Fetching from Telegram channel: {channel}")
+                self.logger.info("📡 Fetching from Telegram channel: %s", channel)
                 
-                # Fetch recent posts from each channel
-                channel_posts = await self.telegram_connector.fetch_posts(channel, 50)
+                # Fetch recent posts from the channel, bounded to the briefing window
+                channel_posts = await self.telegram_connector.fetch_posts(channel, 50, since=cutoff_date)
+                if not channel_posts:
+                    return channel, None, None
+                
+                # Filter to last 4 days and add source info
+                filtered_posts = []
+                append = filtered_posts.append
+                for post in channel_posts:
+                    if (date := post.get('date')) is not None and date >= cutoff_date:
+                        post['connector_type'] = TELEGRAM_CONNECTOR_TYPE
+                        post['source_type'] = TELEGRAM_SOURCE_TYPE
+                        append(post)
+                
+                return channel, filtered_posts, None
                 
-                if channel_posts:
-                    # Filter to last 4 days and add source info
-                    filtered_posts = []
-                    for post in channel_posts:
-                        if post.get('date') and post['date'] >= cutoff_date:
-                            post['connector_type'] = 'telegram'
-                            post['source_type'] = 'telegram_channel'
-                            filtered_posts.append(post)
-                    
-                    telegram_posts.extend(filtered_posts)
-                    self.test_results["successful_telegram_channels"] += 1
-                    self.logger.info(f"   ✅ {channel}: {len(filtered_posts)} posts from last 4 days")
-                else:
-                    self.test_results["failed_telegram_channels"] += 1
-                    self.logger.warning(f"   ⚠️ {channel}: No posts retrieved")
-                    
             except Exception as e:
+                return channel, None, e
+        
+        # Fetch all channels concurrently; the connector paces the requests itself
+        results = await asyncio.gather(*(_one(c) for c in channels), return_exceptions=True)
+        
+        for channel, filtered_posts, error in results:
+            if error is not None:
+                self.test_results["failed_telegram_channels"] += 1
+                self.logger.error("   ❌ Failed to fetch from %s: %s", channel, error)
+                self.test_results["errors"].append(f"Telegram channel {channel}: {str(error)}")
+            elif filtered_posts is None:
                 self.test_results["failed_telegram_channels"] += 1
-                self.logger.error(f"   ❌ Failed to fetch from {channel}: {e}")
-                self.test_results["errors"].append(f"Telegram channel {channel}: {str(e)}")
-                continue
+                self.logger.warning("   ⚠️ %s: No posts retrieved", channel)
+            else:
+                telegram_posts.extend(filtered_posts)
+                self.test_results["successful_telegram_channels"] += 1
+                self.logger.info("   ✅ %s: %s posts from last 4 days", channel, len(filtered_posts))
         
+        # Filtered posts always carry a date, so the key needs no default
+        telegram_posts.sort(key=itemgetter('date'), reverse=True)
         return telegram_posts
     
     async def collect_rss_posts(self, cutoff_date: datetime) -> List[Dict[str, Any]]:
         """Collect posts from all RSS feeds."""
         rss_posts = []
-        
-        config = self.config_manager.get_config()
-        rss_config = self.config_manager.get_platform_config(config, 'rss')
-        feeds = rss_config.get('feeds', [])
+        feeds = self._rss_feeds
         
         self.test_results["rss_feeds_tested"] = len(feeds)
         
-        for feed_url in feeds:
+        async def _one(feed_url):
             try:
-                self.logger.info(f"📡 Fetching from RSS feed: {feed_url}")
+                self.logger.info("📡 Fetching from RSS feed: %s", feed_url)
+                
+                # Fetch recent posts from the feed, bounded to the briefing window
+                feed_posts = await self.rss_connector.fetch_posts(feed_url, 50, since=cutoff_date)
+                if not feed_posts:
+                    return feed_url, None, None
                 
-                # Fetch recent posts from each feed
-                feed_posts = await self.rss_connector.fetch_posts(feed_url, 50)
+                # Filter to last 4 days and add source info
+                filtered_posts = []
+                append = filtered_posts.append
+                for post in feed_posts:
+                    if (date := post.get('date')) is not None and date >= cutoff_date:
+                        post['connector_type'] = RSS_CONNECTOR_TYPE
+                        post['source_type'] = RSS_SOURCE_TYPE
+                        append(post)
+                
+                return feed_url, filtered_posts, None
                 
-                if feed_posts:
-                    # Filter to last 4 days and add source info
-                    filtered_posts = []
-                    for post in feed_posts:
-                        if post.get('date') and post['date'] >= cutoff_date:
-                            post['connector_type'] = 'rss'
-                            post['source_type'] = 'rss_feed'
-                            filtered_posts.append(post)
-                    
-                    rss_posts.extend(filtered_posts)
-                    self.test_results["successful_rss_feeds"] += 1
-                    self.logger.info(f"   ✅ {feed_url}: {len(filtered_posts)} posts from last 4 days")
-                else:
-                    self.test_results["failed_rss_feeds"] += 1
-                    self.logger.warning(f"   ⚠️ {feed_url}: No posts retrieved")
-                    
             except Exception as e:
+                return feed_url, None, e
+        
+        # Feeds live on independent hosts, so fetch them all at once
+        results = await asyncio.gather(*(_one(f) for f in feeds), return_exceptions=True)
+        
+        for feed_url, filtered_posts, error in results:
+            if error is not None:
+                self.test_results["failed_rss_feeds"] += 1
+                self.logger.error("   ❌ Failed to fetch from %s: %s", feed_url, error)
+                self.test_results["errors"].append(f"RSS feed {feed_url}: {str(error)}")
+            elif filtered_posts is None:
                 self.test_results["failed_rss_feeds"] += 1
-                self.logger.error(f"   ❌ Failed to fetch from {feed_url}: {e}")
-                self.test_results["errors"].append(f"RSS feed {feed_url}: {str(e)}")
-                continue
+                self.logger.warning("   ⚠️ %s: No posts retrieved", feed_url)
+            else:
+                rss_posts.extend(filtered_posts)
+                self.test_results["successful_rss_feeds"] += 1
+                self.logger.info("   ✅ %s: %s posts from last 4 days", feed_url, len(filtered_posts))
         
+        rss_posts.sort(key=itemgetter('date'), reverse=True)
         return rss_posts
     
-    def generate_outputs(self, posts: List[Dict[str, Any]]) -> Dict[str, str]:
-        """Generate outputs in Console, HTML, and JSON formats."""
-        self.logger.info("📄 Generating outputs in multiple formats...")
-        
-        output_files = {}
+    async def generate_outputs(self, posts: List[Dict[str, Any]], output_dir: Path = OUTPUT_DIR) -> Dict[str, str]:
+        """Generate outputs in Console, HTML, and JSON formats under output_dir (which must exist)."""
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        
-        try:
-            # 1. Console Output
-            self.logger.info("🖥️ Generating console output...")
-            title = f"I.N.S.I.G.H.T. Combined 4-Day Briefing Test ({len(posts)} posts)"
-            ConsoleOutput.render_briefing_to_console(posts, title)
-            self.test_results["output_formats_generated"].append("console")
-            
-            # 2. HTML Output
-            self.logger.info("🌐 Generating HTML output...")
-            html_output = HTMLOutput(f"I.N.S.I.G.H.T. Combined Briefing Test - {timestamp}")
-            
-            # Organize posts by source for HTML rendering
-            posts_by_source = {}
-            for post in posts:
-                source = post.get('source', 'unknown')
-                if source not in posts_by_source:
-                    posts_by_source[source] = []
-                posts_by_source[source].append(post)
-            
-            html_output.render_briefing(posts_by_source, days=3)
-            html_filename = f"Tests/output/combined_briefing_test_{timestamp}.html"
-            html_output.save_to_file(html_filename)
-            output_files["html"] = html_filename
-            self.test_results["output_formats_generated"].append("html")
-            self.logger.info(f"✅ HTML saved: {html_filename}")
-            
-            # 3. JSON Output
-            self.logger.info("📋 Generating JSON output...")
-            json_output = JSONOutput()
-            
-            # Create mission summary with combined sources
-            all_sources = list(posts_by_source.keys())
-            mission_context = json_output.create_mission_summary(
-                posts, 
-                "4-Day Combined Briefing Workflow Test", 
-                all_sources
-            )
-            
-            json_filename = f"Tests/output/combined_briefing_test_{timestamp}.json"
-            json_output.export_to_file(posts, json_filename, mission_context=mission_context)
-            output_files["json"] = json_filename
-            self.test_results["output_formats_generated"].append("json")
-            self.logger.info(f"✅ JSON saved: {json_filename}")
-            
-        except Exception as e:
-            self.logger.error(f"❌ Output generation failed: {e}")
-            self.test_results["errors"].append(f"Output generation: {str(e)}")
-        
-        return output_files
+        return await generate_briefing_outputs(
+            posts,
+            output_dir / f"combined_briefing_test_{timestamp}",
+            console_title=f"I.N.S.I.G.H.T. Combined 4-Day Briefing Test ({len(posts)} posts)",
+            html_title=f"I.N.S.I.G.H.T. Combined Briefing Test - {timestamp}",
+            mission_name="4-Day Combined Briefing Workflow Test",
+            test_results=self.test_results,
+            logger=self.logger
+        )
     
     def generate_test_report(self, connector_results: Dict, output_files: Dict) -> None:
         """Generate comprehensive test report."""
         self.test_results["end_time"] = datetime.now()
-        duration = (self.test_results["end_time"] - self.test_results["start_time"]).total_seconds()
-        
-        print("\n" + "="*80)
-        print("🧪 I.N.S.I.G.H.T. COMBINED BRIEFING WORKFLOW TEST REPORT")
-        print("="*80)
-        
-        print(f"\n📊 Test Summary:")
-        print(f"   Duration: {duration:.1f} seconds")
-        print(f"   Overall Setup Success: {'✅' if self.test_results['setup_success'] else '❌'}")
-        print(f"   Telegram Setup: {'✅' if self.test_results['telegram_setup_success'] else '❌'}")
-        print(f"   RSS Setup: {'✅' if self.test_results['rss_setup_success'] else '❌'}")
-        print(f"   Telegram Tools Discovered: {self.test_results['telegram_tools_discovered']}")
-        print(f"   RSS Tools Discovered: {self.test_results['rss_tools_discovered']}")
-        print(f"   Total Posts Fetched: {self.test_results['total_posts_fetched']}")
-        print(f"   Output Formats Generated: {', '.join(self.test_results['output_formats_generated'])}")
-        
-        print(f"\n📡 Telegram Results:")
-        print(f"   Channels Tested: {self.test_results['telegram_channels_tested']}")
-        print(f"   Posts Fetched: {self.test_results['telegram_posts_fetched']}")
-        print(f"   Successful Channels: {self.test_results['successful_telegram_channels']}")
-        print(f"   Failed Channels: {self.test_results['failed_telegram_channels']}")
-        
-        print(f"\n📡 RSS Results:")
-        print(f"   Feeds Tested: {self.test_results['rss_feeds_tested']}")
-        print(f"   Posts Fetched: {self.test_results['rss_posts_fetched']}")
-        print(f"   Successful Feeds: {self.test_results['successful_rss_feeds']}")
-        print(f"   Failed Feeds: {self.test_results['failed_rss_feeds']}")
-        
-        print(f"\n🔧 Connector Test Results:")
+        duration = time.perf_counter() - self._t0
+        
+        # Build the report in memory and write it to stdout in one go
+        report = io.StringIO()
+        
+        print("\n" + "="*80, file=report)
+        print("🧪 I.N.S.I.G.H.T. COMBINED BRIEFING WORKFLOW TEST REPORT", file=report)
+        print("="*80, file=report)
+        
+        print(f"\n📊 Test Summary:", file=report)
+        print(f"   Duration: {duration:.1f} seconds", file=report)
+        print(f"   Overall Setup Success: {'✅' if self.test_results['setup_success'] else '❌'}", file=report)
+        print(f"   Telegram Setup: {'✅' if self.test_results['telegram_setup_success'] else '❌'}", file=report)
+        print(f"   RSS Setup: {'✅' if self.test_results['rss_setup_success'] else '❌'}", file=report)
+        print(f"   Telegram Tools Discovered: {self.test_results['telegram_tools_discovered']}", file=report)
+        print(f"   RSS Tools Discovered: {self.test_results['rss_tools_discovered']}", file=report)
+        print(f"   Total Posts Fetched: {self.test_results['total_posts_fetched']}", file=report)
+        print(f"   Output Formats Generated: {', '.join(self.test_results['output_formats_generated'])}", file=report)
+        
+        print(f"\n📡 Telegram Results:", file=report)
+        print(f"   Channels Tested: {self.test_results['telegram_channels_tested']}", file=report)
+        print(f"   Posts Fetched: {self.test_results['telegram_posts_fetched']}", file=report)
+        print(f"   Successful Channels: {self.test_results['successful_telegram_channels']}", file=report)
+        print(f"   Failed Channels: {self.test_results['failed_telegram_channels']}", file=report)
+        
+        print(f"\n📡 RSS Results:", file=report)
+        print(f"   Feeds Tested: {self.test_results['rss_feeds_tested']}", file=report)
+        print(f"   Posts Fetched: {self.test_results['rss_posts_fetched']}", file=report)
+        print(f"   Successful Feeds: {self.test_results['successful_rss_feeds']}", file=report)
+        print(f"   Failed Feeds: {self.test_results['failed_rss_feeds']}", file=report)
+        
+        print(f"\n🔧 Connector Test Results:", file=report)
         for connector_type, results in connector_results.items():
-            print(f"   {connector_type.upper()}:")
+            print(f"   {connector_type.upper()}:", file=report)
             for method_name, result in results.items():
                 status = "✅" if result.get("success", False) else "❌"
-                print(f"     {status} {method_name}: {result}")
+                print(f"     {status} {method_name}: {result}", file=report)
         
-        print(f"\n📄 Generated Files:")
+        print(f"\n📄 Generated Files:", file=report)
         for format_type, filename in output_files.items():
-            print(f"   📁 {format_type.upper()}: {filename}")
+            print(f"   📁 {format_type.upper()}: {filename}", file=report)
         
         if self.test_results["errors"]:
-            print(f"\n❌ Errors Encountered ({len(self.test_results['errors'])}):")
+            print(f"\n❌ Errors Encountered ({len(self.test_results['errors'])}):", file=report)
             for error in self.test_results["errors"]:
-                print(f"   - {error}")
+                print(f"   - {error}", file=report)
         else:
-            print(f"\n✅ No errors encountered!")
+            print(f"\n✅ No errors encountered!", file=report)
         
         # Success criteria
         success_criteria = [
@@ -551,23 +547,26 @@ class CombinedBriefingWorkflowTest:
         # Calculate success rates
         if self.test_results["telegram_channels_tested"] > 0:
             telegram_success_rate = (self.test_results["successful_telegram_channels"] / self.test_results["telegram_channels_tested"]) * 100
-            print(f"\n📈 Telegram Success Rate: {telegram_success_rate:.1f}% ({self.test_results['successful_telegram_channels']}/{self.test_results['telegram_channels_tested']})")
+            print(f"\n📈 Telegram Success Rate: {telegram_success_rate:.1f}% ({self.test_results['successful_telegram_channels']}/{self.test_results['telegram_channels_tested']})", file=report)
         
         if self.test_results["rss_feeds_tested"] > 0:
             rss_success_rate = (self.test_results["successful_rss_feeds"] / self.test_results["rss_feeds_tested"]) * 100
-            print(f"📈 RSS Success Rate: {rss_success_rate:.1f}% ({self.test_results['successful_rss_feeds']}/{self.test_results['rss_feeds_tested']})")
+            print(f"📈 RSS Success Rate: {rss_success_rate:.1f}% ({self.test_results['successful_rss_feeds']}/{self.test_results['rss_feeds_tested']})", file=report)
         
-        print(f"\n🎯 Overall Test Result: {'✅ SUCCESS' if overall_success else '❌ PARTIAL SUCCESS'}")
+        print(f"\n🎯 Overall Test Result: {'✅ SUCCESS' if overall_success else '❌ PARTIAL SUCCESS'}", file=report)
         
         if overall_success:
-            print("🎉 All combined briefing test objectives completed successfully!")
-            print("📋 Posts have been sorted by date in descending order (most recent first)")
+            print("🎉 All combined briefing test objectives completed successfully!", file=report)
+            print("📋 Posts have been sorted by date in descending order (most recent first)", file=report)
         else:
-            print("⚠️ Some test objectives were not met, but basic functionality works.")
+            print("⚠️ Some test objectives were not met, but basic functionality works.", file=report)
             if self.test_results["failed_telegram_channels"] > 0 or self.test_results["failed_rss_feeds"] > 0:
-                print("💡 Note: Some sources failed - this may indicate connectivity or configuration issues.")
+                print("💡 Note: Some sources failed - this may indicate connectivity or configuration issues.", file=report)
         
-        print("="*80)
+        print("="*80, file=report)
+        
+        sys.stdout.write(report.getvalue())
+        sys.stdout.flush()
     
     async def cleanup(self):
         """Clean up test resources."""
@@ -576,14 +575,14 @@ class CombinedBriefingWorkflowTest:
                 await self.telegram_connector.disconnect()
                 self.logger.info("✅ Telegram connector disconnected")
             except Exception as e:
-                self.logger.error(f"❌ Telegram cleanup error: {e}")
+                self.logger.error("❌ Telegram cleanup error: %s", e)
         
         if self.rss_connector:
             try:
                 await self.rss_connector.disconnect()
                 self.logger.info("✅ RSS connector disconnected")
             except Exception as e:
-                self.logger.error(f"❌ RSS cleanup error: {e}")
+                self.logger.error("❌ RSS cleanup error: %s", e)
 
 async def main():
     """Main test execution function."""
@@ -591,14 +590,16 @@ async def main():
     print("🔗 Testing both Telegram and RSS connectors together")
     
     # Create output directory if it doesn't exist
-    os.makedirs("Tests/output", exist_ok=True)
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     
     test = CombinedBriefingWorkflowTest()
     
     try:
-        # Setup test environment for both connectors
+        # Setup test environment for both connectors; with neither available there
+        # is nothing to collect or render, so report the setup failure and stop
         if not await test.setup_test_environment():
-            print("❌ Test setup failed. Exiting.")
+            print("❌ Test setup failed. Skipping connector tests, collection and outputs.")
+            test.generate_test_report({}, {})
             return
         
         # Test individual connector methods
@@ -616,7 +617,7 @@ async def main():
             print("Proceeding with empty dataset for output format testing...")
         
         # Generate outputs in all formats (even with empty data to test format generation)
-        output_files = test.generate_outputs(briefing_posts)
+        output_files = await test.generate_outputs(briefing_posts, OUTPUT_DIR)
         
         # Generate comprehensive test report
         test.generate_test_report(connector_results, output_files)
@@ -630,5 +631,10 @@ async def main():
         await test.cleanup()
 
 if __name__ == "__main__":
-    # Run the combined briefing test
-    asyncio.run(main())
\ No newline at end of file
+    # Run the combined briefing test on the libuv-backed event loop when available (not on Windows)
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
\ No newline at end of file
@@ -151,6 +151,7 @@ class InsightV4DaySorting:
         # title = f"Telegram Posts from {len(channels)} channels ({len(sorted_posts)} total, sorted by date)"
         # await self.display_posts(sorted_posts, title)
         
+        await self.rss_connector.disconnect()
         await self.telegram_connector.disconnect()
         await self.gemini_processor.disconnect()
 
@@ -17,8 +17,9 @@ import os
 import sys
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timezone, timedelta
-from collections import defaultdict
-import pytz
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -30,22 +31,56 @@ from output.console_output import ConsoleOutput
 from output.html_output import HTMLOutput
 from processors.ai.gemini_processor import GeminiProcessor
 
+# Sort sentinel for posts without a date; aware, so it compares against localized dates
+_UTC_MIN = datetime.min.replace(tzinfo=timezone.utc)
+
+def _date_sort_key(post: Dict[str, Any]) -> datetime:
+    """Sort key that places posts without a date last (newest first); the post itself is not modified."""
+    return post.get('date') or _UTC_MIN
+
+@lru_cache(maxsize=4096)
+def _to_user_timezone(dt: datetime, user_timezone: timezone) -> datetime:
+    """
+    Convert a datetime to a fixed-offset user timezone (naive datetimes are taken as UTC).
+    
+    Memoized per (datetime, timezone): posts published in the same batch share
+    timestamps, and a changed user timezone simply produces new cache keys.
+    """
+    if dt.tzinfo is None:
+        return (dt + user_timezone.utcoffset(None)).replace(tzinfo=user_timezone)
+    return dt.astimezone(user_timezone)
+
 class InsightV12TimezoneAware:
 
-    def __init__(self, user_timezone_offset: int = 4):
+    # Parsed config shared by every instance; the file is read once per process
+    _cached_config = None
+
+    def __init__(self, user_timezone_offset: int = 4, debug_timezone_info: bool = False):
         """
         Initialize with user timezone configuration
         
         Args:
             user_timezone_offset: User's timezone offset from UTC (e.g., +4 for GMT+4)
+            debug_timezone_info: Attach a 'timezone_info' dict with original/local times to each post
         """
         self.config_manager = ConfigManager()
         self.limit = 10
+        self.debug_timezone_info = debug_timezone_info
         # User timezone configuration - default +4 GMT as requested
+        self.set_user_timezone(user_timezone_offset)
+        
+        print(f"🕐 Configured user timezone: {self._gmt_label}")
+    
+    def set_user_timezone(self, user_timezone_offset: int):
+        """
+        Set the user's timezone used for conversions
+        
+        Args:
+            user_timezone_offset: User's timezone offset from UTC (e.g., +4 for GMT+4)
+        """
         self.user_timezone_offset = user_timezone_offset
         self.user_timezone = timezone(timedelta(hours=user_timezone_offset))
-        
-        print(f"🕐 Configured user timezone: GMT{'+' if user_timezone_offset >= 0 else ''}{user_timezone_offset}")
+        self._gmt_label = f"GMT{'+' if user_timezone_offset >= 0 else ''}{user_timezone_offset}"
     
     def convert_to_user_timezone(self, dt: datetime) -> datetime:
         """
@@ -57,20 +92,43 @@ class InsightV12TimezoneAware:
         Returns:
             Datetime object converted to user's timezone
         """
-        if dt == datetime.min:
+        # Identity checks: comparing an aware dt to the naive datetime.min costs more than a cached conversion
+        if dt is datetime.min or dt is _UTC_MIN:
             return dt
             
         try:
-            # If datetime is naive (no timezone), assume it's UTC
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            
-            # Convert to user's timezone
-            return dt.astimezone(self.user_timezone)
+            # Convert to user's timezone (naive datetimes are assumed UTC)
+            return _to_user_timezone(dt, self.user_timezone)
         except Exception as e:
             print(f"Warning: Failed to convert timezone for {dt}: {e}")
             return dt
     
+    def _localize_post(self, post: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert a single post's date to user's timezone
+        
+        The date is converted in place (connector posts are throwaway dicts); with
+        debug_timezone_info a copy carrying a 'timezone_info' dict is returned instead.
+        Posts without a date are returned unchanged; sort them with _date_sort_key.
+        """
+        if not post.get('date'):
+            return post
+        
+        original_date = post['date']
+        converted_date = self.convert_to_user_timezone(original_date)
+        
+        if self.debug_timezone_info:
+            # Copy so the original post keeps its UTC timestamp for comparison
+            post = post.copy()
+            post['timezone_info'] = {
+                'original_utc': original_date.isoformat(),
+                'user_local': converted_date.isoformat(),
+                'user_timezone': self._gmt_label
+            }
+        
+        post['date'] = converted_date
+        return post
+    
     def convert_posts_timezone(self, posts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Convert all post timestamps to user's timezone
@@ -81,76 +139,84 @@ class InsightV12TimezoneAware:
         Returns:
             Posts with timestamps converted to user's timezone
         """
-        converted_posts = []
-        
-        for post in posts:
-            if not isinstance(post, dict):
-                continue
-                
-            # Create a copy to avoid modifying original
-            converted_post = post.copy()
-            
-            # Convert the main date field
-            if 'date' in converted_post:
-                original_date = converted_post['date']
-                converted_date = self.convert_to_user_timezone(original_date)
-                converted_post['date'] = converted_date
-                
-                # Add timezone information for debugging
-                converted_post['timezone_info'] = {
-                    'original_utc': original_date.isoformat() if isinstance(original_date, datetime) else str(original_date),
-                    'user_local': converted_date.isoformat() if isinstance(converted_date, datetime) else str(converted_date),
-                    'user_timezone': f"GMT{'+' if self.user_timezone_offset >= 0 else ''}{self.user_timezone_offset}"
-                }
-            
-            converted_posts.append(converted_post)
-        
-        return converted_posts
+        return [self._localize_post(post) for post in posts if isinstance(post, dict)]
     
     def sort_posts_by_date(self, posts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Sort posts by date (newest first) using user's timezone
         """
-        # Convert posts to user timezone first
-        timezone_posts = self.convert_posts_timezone(posts)
-        
+        # Convert while sorting; no intermediate converted list is built
         return sorted(
-            timezone_posts, 
-            key=lambda post: post.get('date', datetime.min), 
+            (self._localize_post(post) for post in posts if isinstance(post, dict)),
+            key=_date_sort_key,
             reverse=True
         )
     
-    def sort_posts_by_day(self, posts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def localize_dated_posts(self, posts: List[Dict[str, Any]], target_days: Optional[frozenset] = None):
+        """
+        Convert posts to user's timezone, yielding only those with a usable date
+        
+        Args:
+            posts: List of post dicts (as returned by connectors) with potentially UTC timestamps
+            target_days: Optional set of 'YYYY-MM-DD' local days to keep; other posts are dropped
+        """
+        for post in posts:
+            post = self._localize_post(post)
+            post_date = post.get('date')
+            # Posts without a date have no day to group under
+            if not isinstance(post_date, datetime):
+                continue
+            if target_days and post_date.date().isoformat() not in target_days:
+                continue
+            yield post
+    
+    def group_posts_by_day(self, dated_posts: List[Dict[str, Any]]) -> Dict[Any, List[Dict[str, Any]]]:
+        """
+        Group already localized posts by day (newest day and post first)
+        """
+        # One sort newest first, then split into runs of the same (user timezone) day
+        dated_posts.sort(key=itemgetter('date'), reverse=True)
+        return {
+            day: list(day_posts)
+            for day, day_posts in groupby(dated_posts, key=lambda post: post['date'].date())
+        }
+    
+    def sort_posts_by_day(self, posts: List[Dict[str, Any]], target_days: Optional[frozenset] = None) -> List[Dict[str, Any]]:
         """
         Sort posts by day (newest first) using user's timezone
+        
+        Args:
+            posts: List of posts with potentially UTC timestamps
+            target_days: Optional set of 'YYYY-MM-DD' local days to keep; other posts are dropped before sorting
         """
-        # Convert posts to user timezone first
-        timezone_posts = self.convert_posts_timezone(posts)
-        posts_by_day = defaultdict(list)
+        # Drop anything that is not a post dict once, up front
+        posts = [post for post in posts if isinstance(post, dict)]
+        return self.group_posts_by_day(list(self.localize_dated_posts(posts, target_days)))
 
-        # Adding posts by the day (using user's timezone)
-        for post in timezone_posts:
-            post_date = post.get('date', datetime.min)
-            if isinstance(post_date, datetime):
-                # Use the converted timezone date for day grouping
-                day_key = post_date.date()
-                posts_by_day[day_key].append(post)
-        
-        # Sorting days
-        sorted_by_days = {}
-        for day in sorted(posts_by_day.keys(), reverse=True):
-            sorted_by_days[day] = sorted(
-                posts_by_day[day],
-                key = lambda p: p.get('date', datetime.min),
-                reverse=True
-            )
-        
-        return sorted_by_days
+    @staticmethod
+    async def _fetch_source(source: str, fetch) -> tuple:
+        """Await a connector fetch, returning (source, posts or the raised exception)"""
+        try:
+            return source, await fetch
+        except Exception as e:
+            return source, e
+
+    @staticmethod
+    def _render_and_save_html(day, briefing: str, day_posts: List[Dict[str, Any]], html_title: str, filename: str):
+        """Render a daily briefing to HTML and write it to disk (blocking; run in a worker thread)"""
+        html_output = HTMLOutput(html_title)
+        html_output.render_daily_briefing(day, briefing, day_posts)
+        html_output.save_to_file(filename)
+
+    async def _write_html_briefing(self, day, briefing: str, day_posts: List[Dict[str, Any]], html_title: str, filename: str):
+        """Write a daily briefing HTML file off the event loop"""
+        await asyncio.to_thread(self._render_and_save_html, day, briefing, day_posts, html_title, filename)
+        print(f"💾 Generated HTML briefing: {filename}")
 
     async def display_posts(self, posts: List[Dict[str, Any]], title: str):
         """Display posts in the console with timezone information"""
         # Add timezone info to title
-        timezone_title = f"{title} (Times in GMT{'+' if self.user_timezone_offset >= 0 else ''}{self.user_timezone_offset})"
+        timezone_title = f"{title} (Times in {self._gmt_label})"
         ConsoleOutput.render_report_to_console(posts, timezone_title)
         
     def get_user_timezone_input(self) -> int:
@@ -170,7 +236,7 @@ class InsightV12TimezoneAware:
         
         while True:
             try:
-                user_input = input(f"\nEnter your timezone offset (current: GMT{'+' if self.user_timezone_offset >= 0 else ''}{self.user_timezone_offset}): ").strip()
+                user_input = input(f"\nEnter your timezone offset (current: {self._gmt_label}): ").strip()
                 
                 if not user_input:  # Use current default
                     return self.user_timezone_offset
@@ -191,12 +257,13 @@ class InsightV12TimezoneAware:
         use_interactive = input("Configure timezone interactively? (y/n, default=n): ").strip().lower()
         
         if use_interactive == 'y':
-            self.user_timezone_offset = self.get_user_timezone_input()
-            self.user_timezone = timezone(timedelta(hours=self.user_timezone_offset))
-            print(f"✅ Timezone set to: GMT{'+' if self.user_timezone_offset >= 0 else ''}{self.user_timezone_offset}")
+            self.set_user_timezone(self.get_user_timezone_input())
+            print(f"✅ Timezone set to: {self._gmt_label}")
         
-        # Load config
-        config = self.config_manager.load_config()
+        # Load config (once per process; failed loads are retried next time)
+        if type(self)._cached_config is None:
+            type(self)._cached_config = self.config_manager.load_config() or None
+        config = type(self)._cached_config
         telegram_config = self.config_manager.get_platform_config(config, 'telegram')
         rss_config = self.config_manager.get_platform_config(config, 'rss')
         
@@ -214,78 +281,90 @@ class InsightV12TimezoneAware:
 
         self.gemini_processor.setup_processor()
 
-        await self.rss_connector.connect()
-        await self.telegram_connector.connect()
-        await self.gemini_processor.connect()
+        # Independent handshakes; wait only for the slowest one
+        await asyncio.gather(
+            self.rss_connector.connect(),
+            self.telegram_connector.connect(),
+            self.gemini_processor.connect()
+        )
 
-        # Collect posts from all channels
-        all_posts = []
+        # You can modify target_days or remove the filter entirely
+        target_days = frozenset({'2025-07-08'})  # Remove this filter or modify as needed
         
-        print(f"\n📡 Fetching data with timezone GMT{'+' if self.user_timezone_offset >= 0 else ''}{self.user_timezone_offset}")
+        print(f"\n📡 Fetching data with timezone {self._gmt_label}")
         print("=" * 60)
         
-        for channel in channels:
-            try:
-                posts = await self.telegram_connector.fetch_posts(channel, self.limit)
-                all_posts.extend(posts)
-                print(f"✅ Fetched {len(posts)} posts from @{channel}")
-            except Exception as e:
-                print(f"❌ Error fetching from @{channel}: {e}")
+        # Fetch all channels and feeds concurrently and localize each source's posts as it arrives
+        fetches = [
+            self._fetch_source(f"@{channel}", self.telegram_connector.fetch_posts(channel, self.limit))
+            for channel in channels
+        ] + [
+            self._fetch_source(feed, self.rss_connector.fetch_posts(feed, self.limit))
+            for feed in feeds
+        ]
         
-        for feed in feeds:
-            try:
-                posts = await self.rss_connector.fetch_posts(feed, self.limit)
-                all_posts.extend(posts)
-                print(f"✅ Fetched {len(posts)} posts from {feed}")
-            except Exception as e:
-                print(f"❌ Error fetching from {feed}: {e}")
+        dated_posts = []
+        total_posts = 0
+        for next_fetch in asyncio.as_completed(fetches):
+            source, posts = await next_fetch
+            if isinstance(posts, Exception):
+                print(f"❌ Error fetching from {source}: {posts}")
+                continue
+            total_posts += len(posts)
+            print(f"✅ Fetched {len(posts)} posts from {source}")
+            # Connectors return post dicts, so no per-post type check is needed; only posts on target days are kept
+            dated_posts.extend(self.localize_dated_posts(posts, target_days))
 
-        print(f"\n📊 Total posts collected: {len(all_posts)}")
+        print(f"\n📊 Total posts collected: {total_posts}")
 
-        # Sort by Day with timezone conversion
-        posts_by_days = self.sort_posts_by_day(all_posts)
+        # Sort by Day (posts are already in user's timezone)
+        posts_by_days = self.group_posts_by_day(dated_posts)
 
-        # Show timezone conversion summary
-        if all_posts:
-            sample_post = all_posts[0]
-            if 'timezone_info' in sample_post:
-                print(f"\n🕐 Timezone Conversion Example:")
-                print(f"   Original UTC: {sample_post['timezone_info']['original_utc']}")
-                print(f"   Your Local:   {sample_post['timezone_info']['user_local']}")
+        # Show timezone conversion summary, derived from the newest post's local date on demand
+        if dated_posts:
+            sample_date = dated_posts[0]['date']
+            print(f"\n🕐 Timezone Conversion Example:")
+            print(f"   Original UTC: {sample_date.astimezone(timezone.utc).isoformat()}")
+            print(f"   Your Local:   {sample_date.isoformat()}")
 
-        # You can modify target_days or remove the filter entirely
-        target_days = ['2025-07-08']  # Remove this filter or modify as needed
+        selected_days = list(posts_by_days.items())
 
-        for day, day_posts in posts_by_days.items():
-            # Only show posts for target days (optional filter)
-            if target_days and day.strftime('%Y-%m-%d') not in target_days:
-                continue
-                
-            print(f"\n📅 {day.strftime('%B %d, %Y')} - {len(day_posts)} posts (GMT{'+' if self.user_timezone_offset >= 0 else ''}{self.user_timezone_offset})")
-            title = f"Posts for {day.strftime('%B %d, %Y')} ({len(day_posts)} posts)"
+        # Generate daily briefings for all selected days concurrently
+        briefings = await asyncio.gather(
+            *(self.gemini_processor.daily_briefing(day_posts) for _, day_posts in selected_days)
+        )
+
+        html_tasks = []
+        for (day, day_posts), briefing in zip(selected_days, briefings):
+            # Format the day once per iteration
+            day_pretty = day.strftime('%B %d, %Y')
+            day_filename = day.strftime('%Y_%m_%d')
+
+            print(f"\n📅 {day_pretty} - {len(day_posts)} posts ({self._gmt_label})")
+            title = f"Posts for {day_pretty} ({len(day_posts)} posts)"
             await self.display_posts(day_posts, title)
             
-            # Generate daily briefing
-            briefing = await self.gemini_processor.daily_briefing(day_posts)
-            print(f"\n📋 Daily Briefing (GMT{'+' if self.user_timezone_offset >= 0 else ''}{self.user_timezone_offset}):")
+            print(f"\n📋 Daily Briefing ({self._gmt_label}):")
             print(briefing)
             print("-" * 60)
 
             # Generate HTML with timezone info
-            html_title = f"Daily Briefing for {day.strftime('%B %d, %Y')} (GMT{'+' if self.user_timezone_offset >= 0 else ''}{self.user_timezone_offset})"
-            html_output = HTMLOutput(html_title)
-            html_output.render_daily_briefing(day, briefing, day_posts)
+            html_title = f"Daily Briefing for {day_pretty} ({self._gmt_label})"
+            filename = f"daily_briefing_{day_filename}_{self._gmt_label}.html"
+            # Render and save in a worker thread so the files are written off the event loop
+            html_tasks.append(asyncio.create_task(
+                self._write_html_briefing(day, briefing, day_posts, html_title, filename)
+            ))
 
-            filename = f"daily_briefing_{day.strftime('%Y_%m_%d')}_GMT{'+' if self.user_timezone_offset >= 0 else ''}{self.user_timezone_offset}.html"
-            html_output.save_to_file(filename)
-            print(f"💾 Generated HTML briefing: {filename}")
-            print("-" * 60)
+        await asyncio.gather(*html_tasks)
+        print("-" * 60)
 
+        await self.rss_connector.disconnect()
         await self.telegram_connector.disconnect()
         await self.gemini_processor.disconnect()
         
         print(f"\n✅ V12 Timezone-Aware Processing Complete!")
-        print(f"🕐 All times displayed in GMT{'+' if self.user_timezone_offset >= 0 else ''}{self.user_timezone_offset}")
+        print(f"🕐 All times displayed in {self._gmt_label}")
 
 if __name__ == "__main__":
     # Initialize with +4 GMT as requested (you can change this default)
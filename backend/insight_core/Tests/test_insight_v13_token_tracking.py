@@ -18,6 +18,8 @@ import sys
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timezone, timedelta
 from collections import defaultdict
+from itertools import groupby
+from operator import itemgetter
 import pytz
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -30,61 +32,90 @@ from output.console_output import ConsoleOutput
 from output.html_output import HTMLOutput
 from processors.ai.gemini_processor import GeminiProcessor
 
+# Sort-key fallback for posts without an aware date, built once instead of per sort
+_UTC_MIN = datetime.min.replace(tzinfo=timezone.utc)
+
 class InsightV13TokenTracking:
 
-    def __init__(self, user_timezone_offset: int = 4):
+    def __init__(self, user_timezone_offset: int = 4, use_batch_api: bool = False, debug_timezone_info: bool = False):
         """
         Initialize with user timezone configuration and token tracking
         
         Args:
             user_timezone_offset: User's timezone offset from UTC (e.g., +4 for GMT+4)
+            use_batch_api: Submit all daily briefings as one Gemini batch job (half price, results may take minutes to hours)
+            debug_timezone_info: Attach a 'timezone_info' dict with original/local times to each post
         """
         self.config_manager = ConfigManager()
         self.limit = 30
+        self.debug_timezone_info = debug_timezone_info
         # User timezone configuration - default +4 GMT as requested
-        self.user_timezone_offset = user_timezone_offset
-        self.user_timezone = timezone(timedelta(hours=user_timezone_offset))
+        self.set_user_timezone(user_timezone_offset)
         
         # Token tracking
         self.total_input_tokens = 0
         self.total_output_tokens = 0
+        self.total_cached_tokens = 0
         self.total_api_calls = 0
+        self.total_cost = 0.0
         self.token_stats = []
+        # Running per-operation totals, so summaries don't re-sum token_stats
+        self.operation_totals = defaultdict(lambda: {'calls': 0, 'total_tokens': 0, 'total_cost': 0.0})
         
         # Gemini 2.0 Flash pricing (example rates - update with actual pricing)
         self.input_token_rate = 0.00015 / 1000  # $0.15 per 1M input tokens
         self.output_token_rate = 0.0006 / 1000  # $0.60 per 1M output tokens
+        self.cached_input_token_rate = self.input_token_rate / 4  # Context-cache hits bill at 25% of the input rate
+        self.use_batch_api = use_batch_api
+        self.batch_rate_multiplier = 0.5  # Batch API bills tokens at 50% of the interactive rate
         
-        print(f"🕐 Configured user timezone: GMT{'+' if user_timezone_offset >= 0 else ''}{user_timezone_offset}")
+        print(f"🕐 Configured user timezone: {self._tz_label}")
         print(f"📊 Token tracking enabled with cost estimation")
     
-    def track_token_usage(self, operation: str, token_info: Dict[str, Any]):
+    def set_user_timezone(self, user_timezone_offset: int):
+        """
+        Set the user's timezone and its cached "GMT±N" label
+        
+        Args:
+            user_timezone_offset: User's timezone offset from UTC (e.g., +4 for GMT+4)
+        """
+        self.user_timezone_offset = user_timezone_offset
+        self.user_timezone = timezone(timedelta(hours=user_timezone_offset))
+        self._tz_label = f"GMT{'+' if user_timezone_offset >= 0 else ''}{user_timezone_offset}"
+    
+    def track_token_usage(self, operation: str, token_info: Dict[str, Any], rate_multiplier: float = 1.0):
         """
         Track token usage for an operation
         
         Args:
             operation: Name of the operation (e.g., "analyze_post", "daily_briefing")
             token_info: Token usage information from Gemini
+            rate_multiplier: Factor applied to the token rates (e.g. batch_rate_multiplier for batch jobs)
         """
         try:
             prompt_tokens = token_info.get('prompt_tokens', 0) or 0
             response_tokens = token_info.get('response_tokens', 0) or 0
             total_tokens = token_info.get('total_tokens', 0) or 0
+            # Prompt tokens served from Gemini's context cache (included in prompt_tokens)
+            cached_tokens = token_info.get('cached_tokens', 0) or 0
             
             # Update totals
             self.total_input_tokens += prompt_tokens
+            self.total_cached_tokens += cached_tokens
             self.total_output_tokens += response_tokens
             self.total_api_calls += 1
             
             # Calculate costs
-            input_cost = prompt_tokens * self.input_token_rate
-            output_cost = response_tokens * self.output_token_rate
+            input_cost = ((prompt_tokens - cached_tokens) * self.input_token_rate + cached_tokens * self.cached_input_token_rate) * rate_multiplier
+            output_cost = response_tokens * self.output_token_rate * rate_multiplier
             total_cost = input_cost + output_cost
+            self.total_cost += total_cost
             
             # Store stats
             stats = {
                 'operation': operation,
                 'prompt_tokens': prompt_tokens,
+                'cached_tokens': cached_tokens,
                 'response_tokens': response_tokens,
                 'total_tokens': total_tokens,
                 'input_cost': input_cost,
@@ -95,6 +126,11 @@ class InsightV13TokenTracking:
             
             self.token_stats.append(stats)
             
+            operation_total = self.operation_totals[operation]
+            operation_total['calls'] += 1
+            operation_total['total_tokens'] += total_tokens
+            operation_total['total_cost'] += total_cost
+            
             print(f"🔢 {operation}: {prompt_tokens} in + {response_tokens} out = {total_tokens} tokens (${total_cost:.6f})")
             
         except Exception as e:
@@ -107,14 +143,13 @@ class InsightV13TokenTracking:
         Returns:
             Dict with token usage statistics and cost information
         """
-        total_cost = (self.total_input_tokens * self.input_token_rate) + (self.total_output_tokens * self.output_token_rate)
-        
         return {
             'total_api_calls': self.total_api_calls,
             'total_input_tokens': self.total_input_tokens,
             'total_output_tokens': self.total_output_tokens,
+            'total_cached_tokens': self.total_cached_tokens,
             'total_tokens': self.total_input_tokens + self.total_output_tokens,
-            'total_cost': total_cost,
+            'total_cost': self.total_cost,
             'average_tokens_per_call': (self.total_input_tokens + self.total_output_tokens) / max(self.total_api_calls, 1),
             'input_output_ratio': self.total_input_tokens / max(self.total_output_tokens, 1),
             'detailed_stats': self.token_stats
@@ -129,23 +164,18 @@ class InsightV13TokenTracking:
         print(f"🔄 Total API Calls: {summary['total_api_calls']}")
         print(f"📥 Total Input Tokens: {summary['total_input_tokens']:,}")
         print(f"📤 Total Output Tokens: {summary['total_output_tokens']:,}")
+        print(f"♻️ Cached Input Tokens: {summary['total_cached_tokens']:,}")
         print(f"🔢 Total Tokens: {summary['total_tokens']:,}")
         print(f"💰 Estimated Cost: ${summary['total_cost']:.6f}")
         print(f"📈 Avg Tokens/Call: {summary['average_tokens_per_call']:.1f}")
         print(f"📊 Input/Output Ratio: {summary['input_output_ratio']:.2f}:1")
         
-        if summary['detailed_stats']:
+        if self.operation_totals:
             print(f"\n📋 DETAILED OPERATION BREAKDOWN:")
-            operations = defaultdict(list)
-            for stat in summary['detailed_stats']:
-                operations[stat['operation']].append(stat)
-            
-            for operation, stats in operations.items():
-                total_op_tokens = sum(s['total_tokens'] for s in stats)
-                total_op_cost = sum(s['total_cost'] for s in stats)
-                avg_tokens = total_op_tokens / len(stats)
+            for operation, totals in self.operation_totals.items():
+                avg_tokens = totals['total_tokens'] / totals['calls']
                 
-                print(f"  {operation}: {len(stats)} calls, {total_op_tokens:,} tokens, ${total_op_cost:.6f} (avg: {avg_tokens:.1f} tokens/call)")
+                print(f"  {operation}: {totals['calls']} calls, {totals['total_tokens']:,} tokens, ${totals['total_cost']:.6f} (avg: {avg_tokens:.1f} tokens/call)")
 
     def convert_to_user_timezone(self, dt: datetime) -> datetime:
         """
@@ -171,15 +201,60 @@ class InsightV13TokenTracking:
             print(f"Warning: Failed to convert timezone for {dt}: {e}")
             return dt
     
+    def _timezone_info(self, original_date: Any, converted_date: Any) -> Dict[str, str]:
+        """Build the debugging 'timezone_info' dict for a converted post date"""
+        try:
+            original_utc = original_date.isoformat()
+            user_local = converted_date.isoformat()
+        except AttributeError:
+            original_utc, user_local = str(original_date), str(converted_date)
+        
+        return {
+            'original_utc': original_utc,
+            'user_local': user_local,
+            'user_timezone': self._tz_label
+        }
+    
     def convert_posts_timezone(self, posts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
-        Convert all post timestamps to user's timezone
+        Convert all post timestamps to user's timezone, in place
+        
+        Connector posts are throwaway dicts, so their 'date' is rewritten directly;
+        'timezone_info' is only attached when debug_timezone_info is enabled.
         
         Args:
             posts: List of posts with potentially UTC timestamps
             
         Returns:
-            Posts with timestamps converted to user's timezone
+            The same posts with timestamps converted to user's timezone
+        """
+        converted_posts = []
+        
+        for post in posts:
+            if not isinstance(post, dict):
+                continue
+            
+            # Convert the main date field
+            if 'date' in post:
+                original_date = post['date']
+                post['date'] = self.convert_to_user_timezone(original_date)
+                
+                if self.debug_timezone_info:
+                    post['timezone_info'] = self._timezone_info(original_date, post['date'])
+            
+            converted_posts.append(post)
+        
+        return converted_posts
+    
+    def convert_posts_timezone_copy(self, posts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Convert all post timestamps to user's timezone on copies of the posts
+        
+        Args:
+            posts: List of posts with potentially UTC timestamps (left unmodified)
+            
+        Returns:
+            Copied posts with converted timestamps and 'timezone_info' for debugging
         """
         converted_posts = []
         
@@ -193,64 +268,67 @@ class InsightV13TokenTracking:
             # Convert the main date field
             if 'date' in converted_post:
                 original_date = converted_post['date']
-                converted_date = self.convert_to_user_timezone(original_date)
-                converted_post['date'] = converted_date
-                
-                # Add timezone information for debugging
-                converted_post['timezone_info'] = {
-                    'original_utc': original_date.isoformat() if isinstance(original_date, datetime) else str(original_date),
-                    'user_local': converted_date.isoformat() if isinstance(converted_date, datetime) else str(converted_date),
-                    'user_timezone': f"GMT{'+' if self.user_timezone_offset >= 0 else ''}{self.user_timezone_offset}"
-                }
+                converted_post['date'] = self.convert_to_user_timezone(original_date)
+                converted_post['timezone_info'] = self._timezone_info(original_date, converted_post['date'])
             
             converted_posts.append(converted_post)
         
         return converted_posts
     
-    def sort_posts_by_date(self, posts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def sort_posts_by_date(self, posts: List[Dict[str, Any]], skip_convert: bool = False) -> List[Dict[str, Any]]:
         """
         Sort posts by date (newest first) using user's timezone
+        
+        Args:
+            posts: List of posts
+            skip_convert: Posts were already passed through convert_posts_timezone
         """
-        # Convert posts to user timezone first
-        timezone_posts = self.convert_posts_timezone(posts)
-        
-        return sorted(
-            timezone_posts, 
-            key=lambda post: post.get('date', datetime.min), 
-            reverse=True
-        )
+        # Convert posts to user timezone first (unless the caller already did)
+        timezone_posts = posts if skip_convert else self.convert_posts_timezone(posts)
+        
+        # Precompute aware sort keys once; missing or naive dates sort last instead of raising TypeError
+        keyed = []
+        for post in timezone_posts:
+            post_date = post.get('date')
+            if not isinstance(post_date, datetime) or post_date.tzinfo is None:
+                post_date = _UTC_MIN
+            keyed.append((post_date, post))
+        
+        keyed.sort(key=itemgetter(0), reverse=True)
+        return [post for _, post in keyed]
     
-    def sort_posts_by_day(self, posts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def sort_posts_by_day(self, posts: List[Dict[str, Any]], skip_convert: bool = False) -> List[Dict[str, Any]]:
         """
         Sort posts by day (newest first) using user's timezone
+        
+        Args:
+            posts: List of posts
+            skip_convert: Posts were already passed through convert_posts_timezone
         """
-        # Convert posts to user timezone first
-        timezone_posts = self.convert_posts_timezone(posts)
-        posts_by_day = defaultdict(list)
+        # Convert posts to user timezone first (unless the caller already did)
+        timezone_posts = posts if skip_convert else self.convert_posts_timezone(posts)
+        # Only posts with a real (timezone-aware) date have a day to group under
+        dated_posts = [
+            post for post in timezone_posts
+            if isinstance(post.get('date'), datetime) and post['date'].tzinfo is not None
+        ]
 
-        # Adding posts by the day (using user's timezone)
-        for post in timezone_posts:
-            post_date = post.get('date', datetime.min)
-            if isinstance(post_date, datetime):
-                # Use the converted timezone date for day grouping
-                day_key = post_date.date()
-                posts_by_day[day_key].append(post)
-        
-        # Sorting days
-        sorted_by_days = {}
-        for day in sorted(posts_by_day.keys(), reverse=True):
-            sorted_by_days[day] = sorted(
-                posts_by_day[day],
-                key = lambda p: p.get('date', datetime.min),
-                reverse=True
-            )
-        
-        return sorted_by_days
+        # One sort newest first, then split into runs of the same (user timezone) day
+        dated_posts.sort(key=itemgetter('date'), reverse=True)
+        return {
+            day: list(day_posts)
+            for day, day_posts in groupby(dated_posts, key=lambda p: p['date'].date())
+        }
+
+    async def _save_html(self, html_output: HTMLOutput, filename: str):
+        """Write a rendered HTML briefing to disk off the event loop"""
+        await asyncio.to_thread(html_output.save_to_file, filename)
+        print(f"💾 Generated HTML briefing with token info: {filename}")
 
     async def display_posts(self, posts: List[Dict[str, Any]], title: str):
         """Display posts in the console with timezone information"""
         # Add timezone info to title
-        timezone_title = f"{title} (Times in GMT{'+' if self.user_timezone_offset >= 0 else ''}{self.user_timezone_offset})"
+        timezone_title = f"{title} (Times in {self._tz_label})"
         ConsoleOutput.render_report_to_console(posts, timezone_title)
         
     def get_user_timezone_input(self) -> int:
@@ -270,7 +348,7 @@ class InsightV13TokenTracking:
         
         while True:
             try:
-                user_input = input(f"\nEnter your timezone offset (current: GMT{'+' if self.user_timezone_offset >= 0 else ''}{self.user_timezone_offset}): ").strip()
+                user_input = input(f"\nEnter your timezone offset (current: {self._tz_label}): ").strip()
                 
                 if not user_input:  # Use current default
                     return self.user_timezone_offset
@@ -291,9 +369,8 @@ class InsightV13TokenTracking:
         use_interactive = input("Configure timezone interactively? (y/n, default=n): ").strip().lower()
         
         if use_interactive == 'y':
-            self.user_timezone_offset = self.get_user_timezone_input()
-            self.user_timezone = timezone(timedelta(hours=self.user_timezone_offset))
-            print(f"✅ Timezone set to: GMT{'+' if self.user_timezone_offset >= 0 else ''}{self.user_timezone_offset}")
+            self.set_user_timezone(self.get_user_timezone_input())
+            print(f"✅ Timezone set to: {self._tz_label}")
         
         # Load config
         config = self.config_manager.load_config()
@@ -321,53 +398,65 @@ class InsightV13TokenTracking:
         # Collect posts from all channels
         all_posts = []
         
-        print(f"\n📡 Fetching data with timezone GMT{'+' if self.user_timezone_offset >= 0 else ''}{self.user_timezone_offset}")
+        print(f"\n📡 Fetching data with timezone {self._tz_label}")
         print("=" * 60)
         
-        for channel in channels:
-            try:
-                posts = await self.telegram_connector.fetch_posts(channel, self.limit)
-                all_posts.extend(posts)
-                print(f"✅ Fetched {len(posts)} posts from @{channel}")
-            except Exception as e:
-                print(f"❌ Error fetching from @{channel}: {e}")
+        # Fetch all channels and feeds concurrently; results come back in source order
+        tg_tasks = [self.telegram_connector.fetch_posts(channel, self.limit) for channel in channels]
+        rss_tasks = [self.rss_connector.fetch_posts(feed, self.limit) for feed in feeds]
+        results = await asyncio.gather(*tg_tasks, *rss_tasks, return_exceptions=True)
         
-        for feed in feeds:
-            try:
-                posts = await self.rss_connector.fetch_posts(feed, self.limit)
-                all_posts.extend(posts)
-                print(f"✅ Fetched {len(posts)} posts from {feed}")
-            except Exception as e:
-                print(f"❌ Error fetching from {feed}: {e}")
+        sources = [f"@{channel}" for channel in channels] + list(feeds)
+        for source, posts in zip(sources, results):
+            if isinstance(posts, Exception):
+                print(f"❌ Error fetching from {source}: {posts}")
+                continue
+            all_posts.extend(posts)
+            print(f"✅ Fetched {len(posts)} posts from {source}")
 
         print(f"\n📊 Total posts collected: {len(all_posts)}")
 
-        # Sort by Day with timezone conversion
-        posts_by_days = self.sort_posts_by_day(all_posts)
+        # Convert to user timezone exactly once, then sort by Day
+        all_posts = self.convert_posts_timezone(all_posts)
+        posts_by_days = self.sort_posts_by_day(all_posts, skip_convert=True)
 
-        # Show timezone conversion summary
-        if all_posts:
-            sample_post = all_posts[0]
-            if 'timezone_info' in sample_post:
-                print(f"\n🕐 Timezone Conversion Example:")
-                print(f"   Original UTC: {sample_post['timezone_info']['original_utc']}")
-                print(f"   Your Local:   {sample_post['timezone_info']['user_local']}")
+        # Show timezone conversion summary (built on demand unless debug_timezone_info attached it)
+        sample_date = all_posts[0].get('date') if all_posts else None
+        if isinstance(sample_date, datetime) and sample_date.tzinfo is not None:
+            timezone_info = all_posts[0].get('timezone_info') or self._timezone_info(
+                sample_date.astimezone(timezone.utc), sample_date
+            )
+            print(f"\n🕐 Timezone Conversion Example:")
+            print(f"   Original UTC: {timezone_info['original_utc']}")
+            print(f"   Your Local:   {timezone_info['user_local']}")
 
         # You can modify target_days or remove the filter entirely
         target_days = ['2025-07-11', '2025-07-10', '2025-07-09']  # Update this to current date for testing
 
-        for day, day_posts in posts_by_days.items():
-            # Only show posts for target days (optional filter)
-            if target_days and day.strftime('%Y-%m-%d') not in target_days:
-                continue
-                
-            print(f"\n📅 {day.strftime('%B %d, %Y')} - {len(day_posts)} posts (GMT{'+' if self.user_timezone_offset >= 0 else ''}{self.user_timezone_offset})")
+        # Only show posts for target days (optional filter)
+        selected_days = [
+            (day, day_posts) for day, day_posts in posts_by_days.items()
+            if not target_days or day.strftime('%Y-%m-%d') in target_days
+        ]
+
+        # Batch mode: one Gemini batch job for every selected day, submitted up front
+        batch_results = {}
+        if self.use_batch_api and selected_days:
+            print(f"\n📦 Submitting {len(selected_days)} daily briefings as one Gemini batch job...")
+            batch_results = await self.gemini_processor.daily_briefing_batch(dict(selected_days))
+
+        write_tasks: List[asyncio.Task] = []
+        for day, day_posts in selected_days:
+            print(f"\n📅 {day.strftime('%B %d, %Y')} - {len(day_posts)} posts ({self._tz_label})")
             title = f"Posts for {day.strftime('%B %d, %Y')} ({len(day_posts)} posts)"
             await self.display_posts(day_posts, title)
             
             # Generate daily briefing with token tracking
-            print(f"\n🤖 Generating daily briefing with token tracking...")
-            briefing_result = await self.gemini_processor.daily_briefing_with_tokens(day_posts)
+            if self.use_batch_api:
+                briefing_result = batch_results[day]
+            else:
+                print(f"\n🤖 Generating daily briefing with token tracking...")
+                briefing_result = await self.gemini_processor.daily_briefing_with_tokens(day_posts)
             
             if "error" in briefing_result:
                 print(f"❌ Error generating briefing: {briefing_result['error']}")
@@ -377,33 +466,39 @@ class InsightV13TokenTracking:
             token_info = briefing_result['token_usage']
             
             # Track tokens for this operation
-            self.track_token_usage("daily_briefing", token_info)
+            if self.use_batch_api:
+                self.track_token_usage("daily_briefing_batch", token_info, self.batch_rate_multiplier)
+            else:
+                self.track_token_usage("daily_briefing", token_info)
             
-            print(f"\n📋 Daily Briefing (GMT{'+' if self.user_timezone_offset >= 0 else ''}{self.user_timezone_offset}):")
+            print(f"\n📋 Daily Briefing ({self._tz_label}):")
             print(briefing)
             print("-" * 60)
 
             # Generate HTML with timezone and token info
-            html_title = f"Daily Briefing for {day.strftime('%B %d, %Y')} (GMT{'+' if self.user_timezone_offset >= 0 else ''}{self.user_timezone_offset})"
+            html_title = f"Daily Briefing for {day.strftime('%B %d, %Y')} ({self._tz_label})"
             html_output = HTMLOutput(html_title)
             
             # Add token information to HTML
             token_summary = self.get_token_summary()
             html_output.render_daily_briefing(day, briefing, day_posts)
 
-            filename = f"daily_briefing_{day.strftime('%Y_%m_%d')}_GMT{'+' if self.user_timezone_offset >= 0 else ''}{self.user_timezone_offset}_tokens.html"
-            html_output.save_to_file(filename)
-            print(f"💾 Generated HTML briefing with token info: {filename}")
-            print("-" * 60)
+            filename = f"daily_briefing_{day.strftime('%Y_%m_%d')}_{self._tz_label}_tokens.html"
+            # Write in a worker thread; all files are awaited after the loop
+            write_tasks.append(asyncio.create_task(self._save_html(html_output, filename)))
+
+        await asyncio.gather(*write_tasks)
+        print("-" * 60)
 
         # Display final token summary
         self.display_token_summary()
 
+        await self.rss_connector.disconnect()
         await self.telegram_connector.disconnect()
         await self.gemini_processor.disconnect()
         
         print(f"\n✅ V13 Token Tracking Processing Complete!")
-        print(f"🕐 All times displayed in GMT{'+' if self.user_timezone_offset >= 0 else ''}{self.user_timezone_offset}")
+        print(f"🕐 All times displayed in {self._tz_label}")
         print(f"🔢 Total API cost: ${self.get_token_summary()['total_cost']:.6f}")
 
 if __name__ == "__main__":
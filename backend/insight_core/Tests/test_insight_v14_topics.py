@@ -553,6 +553,7 @@ class InsightV14EnhancedTopics:
         # Display final comprehensive summary
         self.display_token_summary()
 
+        await self.rss_connector.disconnect()
         await self.telegram_connector.disconnect()
         await self.gemini_processor.disconnect()
         
@@ -56,7 +56,7 @@ class TestRunner:
 ║                         "The Validator" - v2.4.0                           ║
 ║                                                                              ║
 ║  Mode: {mode.upper():^10}                                                    ║
-║  Test Cases: {len(self.test_cases.get_all_tests()):^3}                                                        ║
+║  Test Cases: {self.test_cases.count_tests():^3}                                                        ║
 ║  Output Formats: 7 (Console, HTML, JSON, Combinations)                      ║
 ╚══════════════════════════════════════════════════════════════════════════════╝
         """)
@@ -279,13 +279,11 @@ class TestRunner:
         # Initialize I.N.S.I.G.H.T.
         available_connectors = await self.initialize_insight()
         
-        # Get test cases
-        all_tests = self.test_cases.get_all_tests()
+        # Get test cases for the available connectors only
+        total_tests = self.test_cases.count_tests()
+        filtered_tests = list(self.test_cases.get_tests_for_connectors(available_connectors))
         
-        # Filter tests based on available connectors
-        filtered_tests = self.test_cases.filter_tests_by_connectors(all_tests, available_connectors)
-        
-        print(f"\n🎯 Running {len(filtered_tests)} tests (filtered from {len(all_tests)} total)")
+        print(f"\n🎯 Running {len(filtered_tests)} tests (filtered from {total_tests} total)")
         
         if self.mode == 'manual':
             print("\n⚠️  Manual mode: You'll be asked to validate each test result")
@@ -6,6 +6,7 @@ This package provides a unified interface for all I.N.S.I.G.H.T. connectors
 with automatic setup and configuration management.
 """
 
+import asyncio
 import os
 import importlib
 import inspect
@@ -166,6 +167,85 @@ def create_connector(platform: str) -> Optional['BaseConnector']:
         logger.error(f"❌ Failed to create {platform} connector: {e}")
         return None
 
+# Connected connector instances shared between callers, keyed by platform,
+# with the number of callers currently holding each one. Connectors stay
+# pooled when their count drops to zero so later runs reuse the session.
+_shared_connectors: Dict[str, 'BaseConnector'] = {}
+_shared_refcounts: Dict[str, int] = {}
+_shared_lock = asyncio.Lock()
+
+async def get_shared_connector(platform: str) -> Optional['BaseConnector']:
+    """
+    Acquire a connected connector for the platform, reusing one session per process.
+    
+    The first call creates, sets up and connects the connector; later calls
+    return the same instance so repeated runs skip the connection handshake.
+    Every successful call must be paired with release_shared_connector(platform),
+    and release_shared_connectors() must be awaited once at process exit.
+    The instance is shared, so per-caller state must not be set on it.
+    
+    Args:
+        platform: Platform name (automatically detected from available connectors)
+        
+    Returns:
+        Connected connector instance if successful, None otherwise
+    """
+    async with _shared_lock:
+        connector = _shared_connectors.get(platform)
+        if connector is None:
+            connector = create_connector(platform)
+            if not connector:
+                return None
+            
+            try:
+                await connector.connect()
+            except Exception as e:
+                logger.error(f"❌ Failed to connect shared {platform} connector: {e}")
+                return None
+            
+            _shared_connectors[platform] = connector
+            logger.info(f"🔗 Shared {platform} connector connected")
+        
+        _shared_refcounts[platform] = _shared_refcounts.get(platform, 0) + 1
+        return connector
+
+async def _disconnect_shared(platform: str, connector: 'BaseConnector') -> None:
+    """Disconnect a shared connector that has already been removed from the pool."""
+    try:
+        await connector.disconnect()
+        logger.info(f"✅ Shared {platform} connector disconnected")
+    except Exception as e:
+        logger.error(f"❌ Failed to disconnect shared {platform} connector: {e}")
+
+async def release_shared_connector(platform: str) -> None:
+    """
+    Release one reference taken with get_shared_connector().
+    
+    The connector stays connected in the pool even when no holder is left, so
+    the next get_shared_connector() call reuses it; release_shared_connectors()
+    disconnects it at process exit.
+    
+    Args:
+        platform: Platform name passed to get_shared_connector()
+    """
+    async with _shared_lock:
+        count = _shared_refcounts.get(platform, 0) - 1
+        if count > 0:
+            _shared_refcounts[platform] = count
+        else:
+            _shared_refcounts.pop(platform, None)
+
+async def release_shared_connectors() -> None:
+    """
+    Disconnect every pooled connector regardless of outstanding references.
+    
+    Intended for a single teardown at process exit.
+    """
+    async with _shared_lock:
+        _shared_refcounts.clear()
+        while _shared_connectors:
+            await _disconnect_shared(*_shared_connectors.popitem())
+
 def list_discovered_connectors() -> Dict[str, str]:
     """
     Get detailed information about all discovered connectors.
@@ -189,5 +269,8 @@ __all__ = [
     'setup_connectors',
     'get_available_connector_types',
     'create_connector',
+    'get_shared_connector',
+    'release_shared_connector',
+    'release_shared_connectors',
     'AVAILABLE_CONNECTORS'
 ]
\ No newline at end of file
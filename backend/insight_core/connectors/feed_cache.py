@@ -0,0 +1,83 @@
+"""
+I.N.S.I.G.H.T. Feed Cache
+
+File-backed cache of parsed RSS/Atom feeds together with their HTTP
+validators (ETag / Last-Modified), so unchanged feeds can be revalidated
+with a conditional GET and served from disk on a 304 Not Modified.
+
+Layout:
+    <cache_dir>/<sha256(feed_url)>.pickle   {'etag', 'modified', 'feed'}
+
+Freshness is decided by the server: an entry is only reused when the
+feed answers 304 to the validators stored with it.
+"""
+
+import hashlib
+import os
+import pickle
+from typing import Any, Dict, Optional
+
+from ..logs.core.logger_config import get_component_logger
+
+
+class FeedCache:
+    """
+    Per-feed cache of the last successful feedparser result.
+
+    Stored feeds are the parsed objects themselves, so a 304 skips both the
+    download and the feedparser pass.
+    """
+
+    def __init__(self, cache_dir: str):
+        """
+        Args:
+            cache_dir: Directory holding one file per feed URL
+        """
+        self.cache_dir = cache_dir
+        self.logger = get_component_logger('feed_cache')
+
+    def _feed_path(self, feed_url: str) -> str:
+        """Path of the cache file for a feed URL."""
+        return os.path.join(self.cache_dir, f"{hashlib.sha256(feed_url.encode('utf-8')).hexdigest()}.pickle")
+
+    def get(self, feed_url: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached entry for a feed, or None if there is none.
+
+        Args:
+            feed_url: RSS/Atom feed URL
+
+        Returns:
+            Dict with 'etag', 'modified' and the parsed 'feed'
+        """
+        try:
+            with open(self._feed_path(feed_url), 'rb') as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.warning(f"⚠️ Ignoring unreadable cache entry for {feed_url}: {e}")
+            return None
+
+    def put(self, feed_url: str, feed: Any) -> None:
+        """
+        Store a freshly downloaded feed along with its validators.
+
+        Feeds that came back without an ETag or Last-Modified header are not
+        stored, since they could never be revalidated.
+
+        Args:
+            feed_url: RSS/Atom feed URL
+            feed: feedparser result of a 200 response
+        """
+        etag = feed.get('etag')
+        modified = feed.get('modified')
+        if not etag and not modified:
+            return
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(self._feed_path(feed_url), 'wb') as f:
+                pickle.dump({'etag': etag, 'modified': modified, 'feed': feed}, f)
+        except Exception as e:
+            self.logger.warning(f"⚠️ Failed to cache feed {feed_url}: {e}")
@@ -0,0 +1,100 @@
+"""
+I.N.S.I.G.H.T. History Cache
+
+File-backed cache of fetched posts keyed by (source, UTC day), so repeated
+runs over the same window don't refetch history that can no longer change.
+
+Layout:
+    <cache_dir>/<source>/<YYYY-MM-DD>.json      posts published that day
+    <cache_dir>/<source>/<YYYY-MM-DD>.complete  marker: day closed and fully fetched
+
+Days carrying a .complete marker are served indefinitely. Days without one
+(today, or a day stored before it rolled over) are only served while the
+file is younger than the freshness window.
+"""
+
+import json
+import os
+import time
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional
+
+from ..logs.core.logger_config import get_component_logger
+
+
+class HistoryCache:
+    """
+    Per-day post cache for a single platform.
+
+    Posts are stored in the unified format with their 'date' serialized as
+    ISO 8601 and restored to a datetime on read.
+    """
+
+    def __init__(self, cache_dir: str, fresh_seconds: int = 600):
+        """
+        Args:
+            cache_dir: Directory holding one sub-directory per source
+            fresh_seconds: How long an incomplete (still open) day stays valid
+        """
+        self.cache_dir = cache_dir
+        self.fresh_seconds = fresh_seconds
+        self.logger = get_component_logger('history_cache')
+
+    def _day_path(self, source: str, day: date) -> str:
+        """Path of the JSON file for a source/day pair, without extension."""
+        return os.path.join(self.cache_dir, source.lstrip('@'), day.isoformat())
+
+    def get(self, source: str, day: date) -> Optional[List[Dict[str, Any]]]:
+        """
+        Return the cached posts for a day, or None if missing or stale.
+
+        Args:
+            source: Source identifier (e.g. channel username)
+            day: UTC calendar day
+        """
+        base_path = self._day_path(source, day)
+        json_path = f"{base_path}.json"
+
+        try:
+            if not os.path.exists(f"{base_path}.complete"):
+                if time.time() - os.path.getmtime(json_path) > self.fresh_seconds:
+                    return None
+
+            with open(json_path, 'r', encoding='utf-8') as f:
+                posts = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+        for post in posts:
+            if post.get('date'):
+                post['date'] = datetime.fromisoformat(post['date'])
+
+        return posts
+
+    def put(self, source: str, day: date, posts: List[Dict[str, Any]], complete: bool) -> None:
+        """
+        Store the posts for a day.
+
+        Args:
+            source: Source identifier (e.g. channel username)
+            day: UTC calendar day
+            posts: Every post published on that day
+            complete: Whether the day has closed, making the data immutable
+        """
+        base_path = self._day_path(source, day)
+
+        try:
+            os.makedirs(os.path.dirname(base_path), exist_ok=True)
+
+            serializable_posts = [
+                {**post, 'date': post['date'].isoformat() if post.get('date') else None}
+                for post in posts
+            ]
+            with open(f"{base_path}.json", 'w', encoding='utf-8') as f:
+                json.dump(serializable_posts, f, ensure_ascii=False)
+
+            if complete:
+                open(f"{base_path}.complete", 'w').close()
+
+        except Exception as e:
+            self.logger.warning(f"⚠️ Failed to cache {source} for {day}: {e}")
@@ -0,0 +1,45 @@
+"""
+I.N.S.I.G.H.T. Rate Limiter
+
+Asyncio token bucket used by connectors to pace requests to a steady rate
+instead of bursting into platform flood limits and then sleeping them off.
+"""
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """
+    Token bucket shared by every coroutine of a connector.
+
+    Tokens refill continuously at `rate` per second up to `burst`; acquire()
+    takes one token, waiting just long enough for it to become available.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        """
+        Args:
+            rate: Tokens added per second (steady-state requests per second)
+            burst: Maximum tokens held, i.e. requests allowed back to back
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last update."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    async def acquire(self) -> None:
+        """Take one token, waiting for the bucket to refill if it is empty."""
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
@@ -30,6 +30,9 @@ import json
 
 from .base_connector import BaseConnector
 
+# Sort-key fallback for posts without a date, built once instead of per comparison
+_UTC_MIN = datetime.min.replace(tzinfo=timezone.utc)
+
 
 class RedditConnector(BaseConnector):
     """
@@ -803,7 +806,7 @@ class RedditConnector(BaseConnector):
         
         # Sort chronologically
         try:
-            return sorted(all_posts, key=lambda p: p.get('date', datetime.min.replace(tzinfo=timezone.utc)))
+            return sorted(all_posts, key=lambda p: p.get('date', _UTC_MIN))
         except Exception as e:
             self.logger.error(f"Error sorting Reddit posts chronologically: {e}")
             return all_posts
@@ -5,12 +5,22 @@ import urllib.error
 import socket
 import os
 from datetime import datetime, timezone, timedelta
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from email.utils import parsedate_to_datetime
 import feedparser
 from .base_connector import BaseConnector
 from .tool_registry import expose_tool
 
+# Conditional import for pooled async HTTP (falls back to feedparser's own fetch)
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# Sort-key fallback for posts without a date, built once instead of per comparison
+_UTC_MIN = datetime.min.replace(tzinfo=timezone.utc)
+
 class RssConnector(BaseConnector):
     """
     I.N.S.I.G.H.T. RSS Connector v2.6 - The Grand Marshal Edition
@@ -39,6 +49,14 @@ class RssConnector(BaseConnector):
         self.timeout = None
         self.user_agent = None
         
+        # Optional FeedCache enabling conditional GETs (disabled when None)
+        self.feed_cache = None
+        
+        # Shared keep-alive HTTP session, opened in connect()
+        self._session = None
+        self.MAX_CONNECTIONS = 32
+        self.MAX_CONNECTIONS_PER_HOST = 4
+        
         self.logger.info("RSS Connector object created (pending setup)")
     
     def setup_connector(self) -> bool:
@@ -76,8 +94,11 @@ class RssConnector(BaseConnector):
     
     async def connect(self) -> None:
         """
-        RSS feeds don't require persistent connections.
-        This method validates that feedparser is available.
+        Validate that feedparser is available and open the shared HTTP session.
+        
+        The session pools keep-alive connections and caches DNS, so fetches of
+        many feeds reuse TCP/TLS connections instead of handshaking per feed.
+        Without aiohttp, feeds are fetched by feedparser itself.
         """
         try:
             # Test that feedparser is working
@@ -86,14 +107,121 @@ class RssConnector(BaseConnector):
         except Exception as e:
             self.logger.error(f"RSS connector initialization failed: {e}")
             raise ConnectionError(f"RSS connector setup failed: {e}")
+        
+        if AIOHTTP_AVAILABLE and self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.MAX_CONNECTIONS,
+                    limit_per_host=self.MAX_CONNECTIONS_PER_HOST,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60
+                ),
+                headers={'User-Agent': self.user_agent},
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+            self.logger.info(f"   Shared HTTP session: {self.MAX_CONNECTIONS_PER_HOST} connections per host")
     
     async def disconnect(self) -> None:
         """
-        RSS feeds don't require disconnection.
-        This method is a no-op for RSS but maintains interface compliance.
+        Close the shared HTTP session, if one was opened.
         """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
         self.logger.info("RSS connector cleanup complete")
     
+    async def _load_feed(self, feed_url: str):
+        """
+        Download and parse a feed over the shared session.
+        
+        Conditional GETs work as in _parse_feed: a 304 answer to the cached
+        validators returns the cached parse. Parsing runs in an executor. Without
+        a session (aiohttp missing or connect() not called) this defers to
+        _parse_feed in an executor.
+        
+        Args:
+            feed_url: URL of the RSS/Atom feed
+            
+        Returns:
+            feedparser result
+        """
+        loop = asyncio.get_running_loop()
+        
+        if self._session is None:
+            return await loop.run_in_executor(None, lambda: self._parse_feed(feed_url))
+        
+        cached = self.feed_cache.get(feed_url) if self.feed_cache else None
+        
+        request_headers = {}
+        if cached:
+            if cached['etag']:
+                request_headers['If-None-Match'] = cached['etag']
+            if cached['modified']:
+                request_headers['If-Modified-Since'] = cached['modified']
+        
+        async with self._session.get(feed_url, headers=request_headers) as response:
+            if response.status == 304 and cached:
+                self.logger.info(f"💾 Feed not modified, using cached copy: {feed_url}")
+                return cached['feed']
+            
+            response.raise_for_status()
+            body = await response.read()
+            # response.headers is case-insensitive; read the validators from it directly
+            etag = response.headers.get('ETag')
+            modified = response.headers.get('Last-Modified')
+            # feedparser looks headers up by lowercase name
+            response_headers = {k.lower(): v for k, v in response.headers.items()}
+            status = response.status
+        
+        feed = await loop.run_in_executor(
+            None,
+            lambda: feedparser.parse(body, response_headers=response_headers)
+        )
+        
+        # Parsing from bytes leaves the HTTP fields unset; FeedCache relies on them
+        feed['status'] = status
+        feed['etag'] = etag
+        feed['modified'] = modified
+        
+        if self.feed_cache and status == 200 and feed.entries:
+            self.feed_cache.put(feed_url, feed)
+        
+        return feed
+    
+    def _parse_feed(self, feed_url: str):
+        """
+        Download and parse a feed, revalidating against the feed cache if set.
+        
+        With a cached copy the request carries If-None-Match / If-Modified-Since;
+        a 304 answer returns the cached parse without downloading or parsing
+        the body again. Blocking - run in an executor.
+        
+        Args:
+            feed_url: URL of the RSS/Atom feed
+            
+        Returns:
+            feedparser result
+        """
+        cached = self.feed_cache.get(feed_url) if self.feed_cache else None
+        
+        if not cached:
+            feed = feedparser.parse(feed_url, agent=self.user_agent)
+        else:
+            feed = feedparser.parse(
+                feed_url,
+                agent=self.user_agent,
+                etag=cached['etag'],
+                modified=cached['modified']
+            )
+            if getattr(feed, 'status', None) == 304:
+                self.logger.info(f"💾 Feed not modified, using cached copy: {feed_url}")
+                return cached['feed']
+        
+        if self.feed_cache and getattr(feed, 'status', None) == 200 and feed.entries:
+            self.feed_cache.put(feed_url, feed)
+        
+        return feed
+    
     def _detect_feed_type(self, feed) -> str:
         """
         Detect whether this is RSS, Atom, or other feed format.
@@ -348,15 +476,10 @@ class RssConnector(BaseConnector):
         
         try:
             # Parse feed asynchronously with comprehensive error handling
-            loop = asyncio.get_event_loop()
-            
-            # Wrap the feedparser call with timeout and error handling
+            # Wrap the feed download and parse with timeout and error handling
             try:
                 feed = await asyncio.wait_for(
-                    loop.run_in_executor(
-                        None, 
-                        lambda: feedparser.parse(feed_url, agent=self.user_agent)
-                    ),
+                    self._load_feed(feed_url),
                     timeout=self.timeout
                 )
             except asyncio.TimeoutError:
@@ -475,6 +598,12 @@ class RssConnector(BaseConnector):
                 "type": "int",
                 "description": "Maximum number of posts to fetch (1-1000)",
                 "required": True
+            },
+            "since": {
+                "type": "Optional[datetime]",
+                "description": "Only return entries published at or after this timezone-aware datetime",
+                "required": False,
+                "default": None
             }
         },
         category="rss",
@@ -485,9 +614,9 @@ class RssConnector(BaseConnector):
             "fetch_rss_posts('https://feeds.feedburner.com/techcrunch', 20)"
         ],
         returns="List of posts in unified format with platform, source, url, content, date, categories, and media_urls",
-        notes="Automatically detects RSS vs Atom format. Extracts categories from feed entries. Includes both cleaned text and original HTML content."
+        notes="Automatically detects RSS vs Atom format. Extracts categories from feed entries. Includes both cleaned text and original HTML content. Entries older than 'since' are skipped before content extraction."
     )
-    async def fetch_posts(self, source_identifier: str, limit: int) -> List[Dict[str, Any]]:
+    async def fetch_posts(self, source_identifier: str, limit: int, since: Optional[datetime] = None) -> List[Dict[str, Any]]:
         """PUBLIC API: Fetch RSS posts with complete protection."""
         # Input validation
         if not source_identifier or not isinstance(source_identifier, str):
@@ -501,7 +630,7 @@ class RssConnector(BaseConnector):
         try:
             # Call internal implementation with timeout protection
             posts = await asyncio.wait_for(
-                self._fetch_posts_internal(source_identifier, limit),
+                self._fetch_posts_internal(source_identifier, limit, since),
                 timeout=self.timeout
             )
             self.logger.info(f"✅ Successfully fetched {len(posts)} posts from RSS feed")
@@ -515,7 +644,7 @@ class RssConnector(BaseConnector):
         return []
 
 
-    async def _fetch_posts_internal(self, source_identifier: str, limit: int) -> List[Dict[str, Any]]:
+    async def _fetch_posts_internal(self, source_identifier: str, limit: int, since: Optional[datetime] = None) -> List[Dict[str, Any]]:
         """
         Fetch the latest N posts from a single RSS/Atom feed.
         Enhanced with category extraction and adaptive feed handling.
@@ -524,6 +653,7 @@ class RssConnector(BaseConnector):
         Args:
             source_identifier: RSS/Atom feed URL
             limit: Maximum number of posts to fetch
+            since: Optional lower bound on entry date; older entries are skipped
             
         Returns:
             List of posts in unified format with categories, empty list on failure
@@ -533,14 +663,9 @@ class RssConnector(BaseConnector):
         
         try:
             # Parse feed asynchronously with comprehensive error handling
-            loop = asyncio.get_event_loop()
-            
             try:
                 feed = await asyncio.wait_for(
-                    loop.run_in_executor(
-                        None, 
-                        lambda: feedparser.parse(feed_url, agent=self.user_agent)
-                    ),
+                    self._load_feed(feed_url),
                     timeout=self.timeout
                 )
             except asyncio.TimeoutError:
@@ -587,6 +712,20 @@ class RssConnector(BaseConnector):
                     break
                     
                 try:
+                    # Extract and normalize timestamp with error handling
+                    try:
+                        timestamp = self._normalize_timestamp(
+                            getattr(entry, 'published_parsed', None) or 
+                            getattr(entry, 'updated_parsed', None)
+                        )
+                    except Exception as e:
+                        self.logger.warning(f"Error normalizing timestamp: {e}")
+                        timestamp = datetime.now(timezone.utc)
+                    
+                    # Skip out-of-window entries before any content extraction
+                    if since is not None and timestamp < since:
+                        continue
+                    
                     # Extract categories with error handling
                     try:
                         categories = self._extract_categories(entry, feed_type)
@@ -602,16 +741,6 @@ class RssConnector(BaseConnector):
                         cleaned_text = getattr(entry, 'title', 'No content available')
                         original_html = cleaned_text
                     
-                    # Extract and normalize timestamp with error handling
-                    try:
-                        timestamp = self._normalize_timestamp(
-                            getattr(entry, 'published_parsed', None) or 
-                            getattr(entry, 'updated_parsed', None)
-                        )
-                    except Exception as e:
-                        self.logger.warning(f"Error normalizing timestamp: {e}")
-                        timestamp = datetime.now(timezone.utc)
-                    
                     # Extract media URLs with error handling
                     try:
                         media_urls = self._extract_media_urls(entry)
@@ -776,7 +905,7 @@ class RssConnector(BaseConnector):
         
         # Sort chronologically with error handling
         try:
-            return sorted(all_posts, key=lambda p: p.get('date', datetime.min.replace(tzinfo=timezone.utc)))
+            return sorted(all_posts, key=lambda p: p.get('date', _UTC_MIN))
         except Exception as e:
             self.logger.error(f"Error sorting posts chronologically: {e}")
             return all_posts 
\ No newline at end of file
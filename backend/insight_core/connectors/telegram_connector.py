@@ -1,11 +1,16 @@
 import asyncio
 import os
 from datetime import datetime, timedelta, timezone
-from typing import List, Dict, Any, Union
+from typing import List, Dict, Any, Optional, Union
 from telethon.sync import TelegramClient
 from telethon.errors import FloodWaitError, ChannelInvalidError, ChannelPrivateError, UsernameInvalidError, UsernameNotOccupiedError, RPCError
 from .base_connector import BaseConnector
 from .tool_registry import expose_tool
+from .rate_limiter import TokenBucket
+from .history_cache import HistoryCache
+
+# Sort-key fallback for posts without a date, built once instead of per comparison
+_UTC_MIN = datetime.min.replace(tzinfo=timezone.utc)
 
 class TelegramConnector(BaseConnector):
     """
@@ -31,26 +36,56 @@ class TelegramConnector(BaseConnector):
         self.session_file = None
         self.client = None
         
-        # Rate limiting defaults
-        self.request_counter = 0
+        # Resolved channel entities, reused across fetches on the same session
+        self._entity_cache = {}
+        
+        # Default HistoryCache for get_briefing_posts when none is passed (disabled when None)
+        self.history_cache = None
+        
+        # Rate limiting defaults: REQUEST_THRESHOLD requests per COOLDOWN_SECONDS on average
         self.REQUEST_THRESHOLD = 10
         self.COOLDOWN_SECONDS = 18
+        self._request_bucket = TokenBucket(self.REQUEST_THRESHOLD / self.COOLDOWN_SECONDS, self.REQUEST_THRESHOLD)
+        
+        # Fan-out limits for concurrent fetch_posts calls (e.g. from get_briefing_posts)
+        self.MAX_CONCURRENT_FETCHES = 4
+        self.FETCH_RATE = 2.0
+        self.FETCH_BURST = 4
+        self._fetch_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_FETCHES)
+        self._fetch_bucket = TokenBucket(self.FETCH_RATE, self.FETCH_BURST)
         
         self.logger.info("TelegramConnector object created (pending setup)")
     
+    def _positive_env(self, name: str, cast: type, default: Union[int, float]) -> Union[int, float]:
+        """
+        Read a positive numeric setting from the environment.
+        
+        Unset values return the default; values that don't parse or aren't
+        positive log a warning and return the default as well.
+        """
+        raw = os.getenv(name)
+        if raw is None:
+            return default
+        
+        try:
+            value = cast(raw)
+        except ValueError:
+            value = None
+        
+        if value is None or not value > 0:
+            self.logger.warning("⚠️ Invalid %s=%r (must be a positive %s), using default %s", name, raw, cast.__name__, default)
+            return default
+        
+        return value
+    
     async def throttle_if_needed(self):
         """
-        Checks the request counter and pauses if the threshold is exceeded.
+        Takes a token from the shared request bucket before an API call.
+        
+        Up to REQUEST_THRESHOLD calls go out back to back; after that calls are
+        spaced to the same average rate instead of stalling for a full cooldown.
         """
-        if self.request_counter >= self.REQUEST_THRESHOLD:
-            self.logger.warning(
-                f"Request threshold ({self.REQUEST_THRESHOLD}) reached. "
-                f"Initiating {self.COOLDOWN_SECONDS}-second cooldown."
-            )
-            await asyncio.sleep(self.COOLDOWN_SECONDS)
-            self.request_counter = 0
-            self.logger.info("Cooldown complete. Resuming operations.")
-        self.request_counter += 1
+        await self._request_bucket.acquire()
 
     
     def setup_connector(self) -> bool:
@@ -96,14 +131,24 @@ class TelegramConnector(BaseConnector):
             #     self.REQUEST_THRESHOLD = 15
             #     self.COOLDOWN_SECONDS = 67
             
+            # Load optional fetch fan-out configuration
+            self.MAX_CONCURRENT_FETCHES = self._positive_env('TELEGRAM_MAX_CONCURRENT_FETCHES', int, self.MAX_CONCURRENT_FETCHES)
+            self.FETCH_RATE = self._positive_env('TELEGRAM_FETCH_RATE', float, self.FETCH_RATE)
+            self.FETCH_BURST = self._positive_env('TELEGRAM_FETCH_BURST', int, self.FETCH_BURST)
+            
+            self._fetch_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_FETCHES)
+            self._fetch_bucket = TokenBucket(self.FETCH_RATE, self.FETCH_BURST)
+            self._request_bucket = TokenBucket(self.REQUEST_THRESHOLD / self.COOLDOWN_SECONDS, self.REQUEST_THRESHOLD)
+            
             self.logger.info("✅ Telegram connector setup successful")
-            self.logger.info(f"   Session file: {self.session_file}")
-            self.logger.info(f"   Rate limiting: {self.REQUEST_THRESHOLD} requests/{self.COOLDOWN_SECONDS}s")
+            self.logger.info("   Session file: %s", self.session_file)
+            self.logger.info("   Rate limiting: %s requests/%ss", self.REQUEST_THRESHOLD, self.COOLDOWN_SECONDS)
+            self.logger.info("   Fetch fan-out: %s concurrent, %s/s (burst %s)", self.MAX_CONCURRENT_FETCHES, self.FETCH_RATE, self.FETCH_BURST)
             
             return True
             
         except Exception as e:
-            self.logger.error(f"❌ Failed to setup Telegram connector: {e}")
+            self.logger.error("❌ Failed to setup Telegram connector: %s", e)
             return False
         
     
@@ -137,6 +182,7 @@ class TelegramConnector(BaseConnector):
         if self.client and self.client.is_connected():
             self.logger.info("Disconnecting from Telegram...")
             await self.client.disconnect()
+        self._entity_cache.clear()
     
     async def _synthesize_messages(self, raw_messages: List, channel_alias: str, source_identifier: str) -> List[Dict[str, Any]]:
         """
@@ -213,6 +259,12 @@ class TelegramConnector(BaseConnector):
                 "type": "Union[int, str]", 
                 "description": "Number of posts (1-1000), negative for message ID start (-123), or '-all' for entire channel", 
                 "required": True
+            },
+            "since": {
+                "type": "Optional[datetime]",
+                "description": "Only return posts published at or after this timezone-aware datetime",
+                "required": False,
+                "default": None
             }
         },
         category="telegram",
@@ -223,9 +275,9 @@ class TelegramConnector(BaseConnector):
             "fetch_recent_posts('important_channel', '-all')"
         ],
         returns="List of posts in unified format with platform, source, url, content, date, media_urls",
-        notes="Use '-all' carefully on large channels. Negative numbers start from specific message ID."
+        notes="Use '-all' carefully on large channels. Negative numbers start from specific message ID. Paging stops once 'since' is passed."
     )
-    async def fetch_posts(self, source_identifier: str, limit: Union[int, str]) -> List[Dict[str, Any]]:
+    async def fetch_posts(self, source_identifier: str, limit: Union[int, str], since: Optional[datetime] = None) -> List[Dict[str, Any]]:
         """
         UNIFIED API: Single method for all Telegram fetching needs.
         
@@ -242,6 +294,8 @@ class TelegramConnector(BaseConnector):
                    - int > 0: Number of recent posts
                    - int < 0: Starting message ID (abs value)
                    - "-all": Fetch entire channel history
+            since: Optional lower bound on post date; history older than this
+                   is neither paged in nor returned
             
         Returns:
             List of posts in unified format, empty list on any failure
@@ -255,7 +309,7 @@ class TelegramConnector(BaseConnector):
         try:
             fetch_mode, fetch_value = self._parse_limit_parameter(limit)
         except ValueError as e:
-            self.logger.error(f"Invalid limit parameter: {e}")
+            self.logger.error("Invalid limit parameter: %s", e)
             return []
         
         # Connection validation
@@ -267,35 +321,139 @@ class TelegramConnector(BaseConnector):
         
         # Log the operation
         if fetch_mode == "recent":
-            self.logger.info(f"🔍 Fetching {fetch_value} recent posts from @{channel_username}")
+            self.logger.info("🔍 Fetching %s recent posts from @%s", fetch_value, channel_username)
         elif fetch_mode == "from_id":
-            self.logger.info(f"🔍 Fetching posts from message ID {fetch_value} from @{channel_username}")
+            self.logger.info("🔍 Fetching posts from message ID %s from @%s", fetch_value, channel_username)
         elif fetch_mode == "all":
-            self.logger.info(f"🔍 Fetching ALL posts from @{channel_username} (database population mode)")
+            self.logger.info("🔍 Fetching ALL posts from @%s (database population mode)", channel_username)
         
         try:
-            # Protected call to internal implementation
-            posts = await asyncio.wait_for(
-                self._fetch_posts_internal(channel_username, fetch_mode, fetch_value),
-                timeout=self._calculate_timeout(fetch_mode)
-            )
+            # Paced, bounded fan-out: concurrent callers queue here instead of bursting into FLOOD_WAIT
+            async with self._fetch_semaphore:
+                await self._fetch_bucket.acquire()
+                
+                # Protected call to internal implementation
+                posts = await asyncio.wait_for(
+                    self._fetch_posts_internal(channel_username, fetch_mode, fetch_value, since),
+                    timeout=self._calculate_timeout(fetch_mode)
+                )
             
-            self.logger.info(f"✅ Successfully fetched {len(posts)} posts from @{channel_username}")
+            self.logger.info("✅ Successfully fetched %s posts from @%s", len(posts), channel_username)
             return posts
             
         except asyncio.TimeoutError:
             timeout = self._calculate_timeout(fetch_mode)
-            self.logger.warning(f"⏰ Fetch from @{channel_username} timed out after {timeout}s")
+            self.logger.warning("⏰ Fetch from @%s timed out after %ss", channel_username, timeout)
             return []
         except Exception as e:
-            self.logger.error(f"❌ Protected fetch failed from @{channel_username}: {str(e)}")
+            self.logger.error("❌ Protected fetch failed from @%s: %s", channel_username, str(e))
             return []
     
+    @expose_tool(
+        name="get_briefing_posts",
+        description="Fetch posts from several Telegram channels covering today and the previous N days",
+        parameters={
+            "channels": {
+                "type": "List[str]",
+                "description": "Channel usernames (with or without @)",
+                "required": True
+            },
+            "days": {
+                "type": "int",
+                "description": "Number of previous days to include in addition to today",
+                "required": True
+            },
+            "posts_per_channel": {
+                "type": "int",
+                "description": "Maximum number of recent posts to fetch per channel",
+                "required": False,
+                "default": 50
+            }
+        },
+        category="telegram",
+        examples=[
+            "get_briefing_posts(['durov', 'telegram'], 3)",
+            "get_briefing_posts(['@ai_newz'], 1, 20)"
+        ],
+        returns="Chronologically sorted list of posts in unified format from all channels",
+        notes="Channel histories are requested concurrently, capped by MAX_CONCURRENT_FETCHES (default 4) and the fetch rate limit (default 2/s, burst 4)."
+    )
+    async def get_briefing_posts(self, channels: List[str], days: int, posts_per_channel: int = 50,
+                                 history_cache: Optional[HistoryCache] = None) -> List[Dict[str, Any]]:
+        """
+        Fetch a multi-channel briefing window with channels fetched concurrently.
+        
+        Channel history requests run in parallel but go through the same fetch
+        limits as the other methods: at most MAX_CONCURRENT_FETCHES (default 4)
+        in flight, paced by the fetch TokenBucket (default 2/s, burst 4). Wall
+        time therefore grows with the number of channels once the burst is used.
+        
+        Args:
+            channels: Telegram channel usernames (with or without @)
+            days: Number of previous days to include in addition to today
+            posts_per_channel: Maximum number of recent posts per channel
+            history_cache: Cache for this call, so callers sharing the connector
+                keep their own; defaults to self.history_cache
+            
+        Returns:
+            Posts from the window sorted chronologically, empty list on failure
+        """
+        if not self.client or not self.client.is_connected():
+            self.logger.error("Telegram client not connected")
+            return []
+        
+        history_cache = history_cache or self.history_cache
+        
+        today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+        cutoff_date = today - timedelta(days=days)
+        
+        self.logger.info("🔍 Fetching briefing posts from %s channels since %s", len(channels), cutoff_date.date())
+        
+        # Serve channels whose whole window is already cached
+        window_days = [(cutoff_date + timedelta(days=offset)).date() for offset in range(days + 1)]
+        briefing_posts = []
+        channels_to_fetch = []
+        for channel in channels:
+            cached_days = [history_cache.get(channel, day) for day in window_days] if history_cache else [None]
+            if any(day_posts is None for day_posts in cached_days):
+                channels_to_fetch.append(channel)
+                continue
+            
+            self.logger.info("💾 Using cached briefing history for %s", channel)
+            for day_posts in cached_days:
+                briefing_posts.extend(day_posts)
+        
+        results = await asyncio.gather(
+            *(self.fetch_posts(channel, posts_per_channel, since=cutoff_date) for channel in channels_to_fetch),
+            return_exceptions=True
+        )
+        
+        for channel, channel_posts in zip(channels_to_fetch, results):
+            if isinstance(channel_posts, Exception):
+                self.logger.error("❌ Briefing fetch failed for %s: %s", channel, channel_posts)
+                continue
+            
+            if history_cache:
+                # Fewer posts than the limit means paging stopped at the cutoff, not the limit;
+                # an empty result may be a swallowed fetch error, so it proves nothing
+                reached_cutoff = 0 < len(channel_posts) < posts_per_channel
+                self._cache_history(history_cache, channel, channel_posts, window_days, reached_cutoff)
+            
+            briefing_posts.extend(
+                post for post in channel_posts
+                if post.get('date') and post['date'] >= cutoff_date
+            )
+        
+        briefing_posts.sort(key=lambda p: p['date'])
+        
+        self.logger.info("✅ Collected %s briefing posts from %s channels", len(briefing_posts), len(channels))
+        return briefing_posts
+    
     # =============================================================================
     # INTERNAL IMPLEMENTATION - Pure Defended Logic
     # =============================================================================
     
-    async def _fetch_posts_internal(self, channel_username: str, mode: str, limit: int) -> List[Dict[str, Any]]:
+    async def _fetch_posts_internal(self, channel_username: str, mode: str, limit: int, since: Optional[datetime] = None) -> List[Dict[str, Any]]:
         """
         INTERNAL: Pure Telegram post fetching logic without external protections.
         
@@ -308,6 +466,7 @@ class TelegramConnector(BaseConnector):
         Args:
             channel_username: Clean channel username (no @ prefix)
             limit: Valid positive integer
+            since: Optional lower bound on post date
             
         Returns:
             List of posts in unified format
@@ -323,33 +482,36 @@ class TelegramConnector(BaseConnector):
         
         try:
             # Get channel entity with comprehensive error handling
-            await self.throttle_if_needed()
+            entity = self._entity_cache.get(channel_username)
             
             try:
-                entity = await self.client.get_entity(channel_username)
+                if entity is None:
+                    await self.throttle_if_needed()
+                    entity = await self.client.get_entity(channel_username)
+                    self._entity_cache[channel_username] = entity
             except ChannelInvalidError:
-                self.logger.error(f"ERROR: Failed to process @{channel_username} - Reason: Channel does not exist or is invalid")
+                self.logger.error("ERROR: Failed to process @%s - Reason: Channel does not exist or is invalid", channel_username)
                 raise ValueError(f"Channel @{channel_username} does not exist or is invalid")
             except ChannelPrivateError:
-                self.logger.error(f"ERROR: Failed to process @{channel_username} - Reason: Channel is private or requires subscription")
+                self.logger.error("ERROR: Failed to process @%s - Reason: Channel is private or requires subscription", channel_username)
                 raise ValueError(f"Channel @{channel_username} is private or requires subscription")
             except UsernameInvalidError:
-                self.logger.error(f"ERROR: Failed to process @{channel_username} - Reason: Invalid username format")
+                self.logger.error("ERROR: Failed to process @%s - Reason: Invalid username format", channel_username)
                 raise ValueError(f"Invalid username format: @{channel_username}")
             except UsernameNotOccupiedError:
-                self.logger.error(f"ERROR: Failed to process @{channel_username} - Reason: Username not found")
+                self.logger.error("ERROR: Failed to process @%s - Reason: Username not found", channel_username)
                 raise ValueError(f"Username not found: @{channel_username}")
             except (ConnectionError, TimeoutError) as e:
-                self.logger.error(f"ERROR: Failed to process @{channel_username} - Reason: Network error: {str(e)}")
+                self.logger.error("ERROR: Failed to process @%s - Reason: Network error: %s", channel_username, str(e))
                 raise ConnectionError(f"Network error accessing @{channel_username}: {str(e)}")
             except FloodWaitError as e:
-                self.logger.error(f"ERROR: Failed to process @{channel_username} - Reason: Rate limit exceeded, need to wait {e.seconds} seconds")
+                self.logger.error("ERROR: Failed to process @%s - Reason: Rate limit exceeded, need to wait %s seconds", channel_username, e.seconds)
                 raise ConnectionError(f"Rate limit exceeded for @{channel_username}, need to wait {e.seconds} seconds")
             except RPCError as e:
-                self.logger.error(f"ERROR: Failed to process @{channel_username} - Reason: Telegram API error: {str(e)}")
+                self.logger.error("ERROR: Failed to process @%s - Reason: Telegram API error: %s", channel_username, str(e))
                 raise ConnectionError(f"Telegram API error for @{channel_username}: {str(e)}")
             except Exception as e:
-                self.logger.error(f"ERROR: Failed to process @{channel_username} - Reason: Unexpected error: {str(e)}")
+                self.logger.error("ERROR: Failed to process @%s - Reason: Unexpected error: %s", channel_username, str(e))
                 raise ConnectionError(f"Unexpected error accessing @{channel_username}: {str(e)}")
             
             # Fetch messages in chunks
@@ -357,7 +519,7 @@ class TelegramConnector(BaseConnector):
                 if len(all_synthesized_posts) >= limit:
                     break
 
-                self.logger.info(f"fetching attempt #{fetch_attempt + 1} for @{channel_username}...")
+                self.logger.info("fetching attempt #%s for @%s...", fetch_attempt + 1, channel_username)
                     
                 try:
                     await self.throttle_if_needed()
@@ -369,27 +531,27 @@ class TelegramConnector(BaseConnector):
                             offset_id=last_message_id
                         )
                     except ChannelPrivateError:
-                            self.logger.error(f"ERROR: Failed to fetch from @{channel_username} - Reason: Channel became private during operation")
+                            self.logger.error("ERROR: Failed to fetch from @%s - Reason: Channel became private during operation", channel_username)
                             break
                     except FloodWaitError as e:
-                        self.logger.warning(f"Rate limit hit for @{channel_username}, waiting {e.seconds} seconds...")
+                        self.logger.warning("Rate limit hit for @%s, waiting %s seconds...", channel_username, e.seconds)
                         await asyncio.sleep(e.seconds)
                         continue
                     except ConnectionError as e:
-                        self.logger.error(f"ERROR: Failed to fetch from @{channel_username} - Reason: Connection lost: {str(e)}")
+                        self.logger.error("ERROR: Failed to fetch from @%s - Reason: Connection lost: %s", channel_username, str(e))
                         break
                     except TimeoutError:
-                        self.logger.error(f"ERROR: Failed to fetch from @{channel_username} - Reason: Message fetch timed out")
+                        self.logger.error("ERROR: Failed to fetch from @%s - Reason: Message fetch timed out", channel_username)
                         break
                     except RPCError as e:
-                        self.logger.error(f"ERROR: Failed to fetch from @{channel_username} - Reason: Telegram API error during fetch: {str(e)}")
+                        self.logger.error("ERROR: Failed to fetch from @%s - Reason: Telegram API error during fetch: %s", channel_username, str(e))
                         break
                     except Exception as e:
-                        self.logger.error(f"ERROR: Failed to fetch from @{channel_username} - Reason: Unexpected error during message fetch: {str(e)}")
+                        self.logger.error("ERROR: Failed to fetch from @%s - Reason: Unexpected error during message fetch: %s", channel_username, str(e))
                         break
                     
                     if not messages:
-                        self.logger.info(f"No messages found in attempt #{fetch_attempt + 1} for @{channel_username}")
+                        self.logger.info("No messages found in attempt #%s for @%s", fetch_attempt + 1, channel_username)
                         break
                     
                     # Synthesize messages with error handling
@@ -398,43 +560,50 @@ class TelegramConnector(BaseConnector):
                         
                         for post in synthesized:
                             try:
+                                if since is not None and post.get('date') and post['date'] < since:
+                                    continue
+                                
                                 # Use URL as unique identifier since we removed id field
                                 post_url = post.get('url')
                                 if post_url and post_url not in processed_ids:
                                     all_synthesized_posts.append(post)
                                     processed_ids.add(post_url)
                             except Exception as e:
-                                self.logger.warning(f"Error processing synthesized post: {e}")
+                                self.logger.warning("Error processing synthesized post: %s", e)
                                 continue
                         
                         last_message_id = messages[-1].id
                         
                     except Exception as e:
-                        self.logger.error(f"Error synthesizing messages from @{channel_username}: {e}")
+                        self.logger.error("Error synthesizing messages from @%s: %s", channel_username, e)
+                        break
+                    
+                    # Messages come newest first: once a chunk reaches past 'since', older pages are out of range
+                    if since is not None and messages[-1].date < since:
                         break
                     
                 except Exception as e:
-                        self.logger.error(f"Error during fetch attempt #{fetch_attempt+1} for @{channel_username}: {e}")
+                        self.logger.error("Error during fetch attempt #%s for @%s: %s", fetch_attempt+1, channel_username, e)
                         # Continue with next attempt unless it's a critical error
                         if fetch_attempt >= max_fetches - 1:
                             break
                         continue
             
             # Sort and return posts with error handling
-                try:
-                    # Sort by date (newest first), then take the limit, then sort chronologically
-                    final_posts = sorted(all_synthesized_posts, key=lambda p: p.get('date', datetime.min.replace(tzinfo=timezone.utc)), reverse=True)[:limit]
-                    result = sorted(final_posts, key=lambda p: p.get('date', datetime.min.replace(tzinfo=timezone.utc)))
-                    
-                    self.logger.info(f"Successfully fetched {len(result)} posts from @{channel_username}")
-                    return result
-                    
-                except Exception as e:
-                    self.logger.error(f"Error sorting posts from @{channel_username}: {e}")
-                    return all_synthesized_posts[:limit]  # Return unsorted if sorting fails
-             
+            try:
+                # Sort by date (newest first), then take the limit, then sort chronologically
+                final_posts = sorted(all_synthesized_posts, key=lambda p: p.get('date', _UTC_MIN), reverse=True)[:limit]
+                result = sorted(final_posts, key=lambda p: p.get('date', _UTC_MIN))
+                
+                self.logger.info("Successfully fetched %s posts from @%s", len(result), channel_username)
+                return result
+                
+            except Exception as e:
+                self.logger.error("Error sorting posts from @%s: %s", channel_username, e)
+                return all_synthesized_posts[:limit]  # Return unsorted if sorting fails
+
         except Exception as e:
-            self.logger.error(f"ERROR: Failed to fetch from @{channel_username} - Reason: Critical error: {str(e)}")
+            self.logger.error("ERROR: Failed to fetch from @%s - Reason: Critical error: %s", channel_username, str(e))
             return []
         
 
@@ -442,6 +611,34 @@ class TelegramConnector(BaseConnector):
     # HELPER METHODS
     # =============================================================================
     
+    def _cache_history(self, history_cache: HistoryCache, channel: str, posts: List[Dict[str, Any]],
+                       window_days: List, reached_cutoff: bool = False) -> None:
+        """
+        Store fetched posts in the history cache, one entry per fully covered day.
+        
+        A day is only covered when the fetch reached back past its start, or the
+        whole window is when reached_cutoff is set; days before today are marked
+        complete since their history can't change.
+        """
+        dates = [post['date'] for post in posts if post.get('date')]
+        if reached_cutoff:
+            oldest_day = window_days[0] - timedelta(days=1)
+        elif dates:
+            oldest_day = min(dates).date()
+        else:
+            return
+        
+        today = datetime.now(timezone.utc).date()
+        
+        posts_by_day = {}
+        for post in posts:
+            if post.get('date'):
+                posts_by_day.setdefault(post['date'].date(), []).append(post)
+        
+        for day in window_days:
+            if oldest_day < day:
+                history_cache.put(channel, day, posts_by_day.get(day, []), complete=day < today)
+    
     def _parse_limit_parameter(self, limit: Union[int, str]) -> tuple[str, int]:
         """
         Parse the flexible limit parameter into fetch mode and value.
@@ -454,34 +651,34 @@ class TelegramConnector(BaseConnector):
         """
         if isinstance(limit, str):
             if limit == "-all":
-                self.logger.info(f"Fetching all posts from channel")
+                self.logger.info("Fetching all posts from channel")
                 return ("all", 0)
             else:
-                self.logger.error(f"Invalid string limit: {limit}. Only '-all' is supported.")
+                self.logger.error("Invalid string limit: %s. Only '-all' is supported.", limit)
                 raise ValueError(f"Invalid string limit: {limit}. Only '-all' is supported.")
         elif isinstance(limit, int):
             if limit > 0:
-                self.logger.info(f"Fetching {limit} recent posts from channel")
+                self.logger.info("Fetching %s recent posts from channel", limit)
                 return ("recent", limit)
             elif limit < 0:
-                self.logger.info(f"Fetching posts from message ID {abs(limit)} from channel")
+                self.logger.info("Fetching posts from message ID %s from channel", abs(limit))
                 return ("from_id", abs(limit))
             else:
-                self.logger.error(f"Limit cannot be zero")
+                self.logger.error("Limit cannot be zero")
                 raise ValueError("Limit cannot be zero")
         else:
-            self.logger.error(f"Invalid limit type: {type(limit)}. Limit must be int or str.")
+            self.logger.error("Invalid limit type: %s. Limit must be int or str.", type(limit))
             raise ValueError(f"Limit must be int or str, got {type(limit)}")
     
     def _calculate_timeout(self, fetch_mode: str) -> int:
         """Calculate appropriate timeout based on fetch mode."""
         if fetch_mode == "all":
-            self.logger.info(f"Calculating timeout for all posts")
+            self.logger.info("Calculating timeout for all posts")
             return self.COOLDOWN_SECONDS * 10  # Much longer timeout for full channel fetch
         elif fetch_mode == "from_id":
-            self.logger.info(f"Calculating timeout for ID-based fetch")
+            self.logger.info("Calculating timeout for ID-based fetch")
             return self.COOLDOWN_SECONDS * 3   # Longer timeout for ID-based fetch
         else:
-            self.logger.info(f"Calculating timeout for recent posts")
+            self.logger.info("Calculating timeout for recent posts")
             return self.COOLDOWN_SECONDS * 2   # Normal timeout for recent posts
     
\ No newline at end of file
@@ -10,6 +10,9 @@ from youtube_transcript_api.formatters import TextFormatter
 from .base_connector import BaseConnector
 from .tool_registry import expose_tool
 
+# Sort-key fallback for posts without a date, built once instead of per comparison
+_UTC_MIN = datetime.min.replace(tzinfo=timezone.utc)
+
 class YouTubeConnector(BaseConnector):
     """
     I.N.S.I.G.H.T. YouTube Connector v3.1 - "The Liberated Spymaster" - Grand Marshal Edition
@@ -650,7 +653,7 @@ class YouTubeConnector(BaseConnector):
                     continue
             
             # Sort by publish date (newest first)
-            all_posts.sort(key=lambda p: p.get('date', datetime.min.replace(tzinfo=timezone.utc)), reverse=True)
+            all_posts.sort(key=lambda p: p.get('date', _UTC_MIN), reverse=True)
             
             self.logger.info(f"Channel processing complete: {successful_extractions} successful, {failed_extractions} failed extractions")
             return all_posts
@@ -712,7 +715,7 @@ class YouTubeConnector(BaseConnector):
         
         # Sort chronologically
         try:
-            return sorted(all_posts, key=lambda p: p.get('date', datetime.min.replace(tzinfo=timezone.utc)))
+            return sorted(all_posts, key=lambda p: p.get('date', _UTC_MIN))
         except Exception as e:
             self.logger.error(f"Error sorting YouTube posts chronologically: {e}")
             return all_posts
@@ -18,6 +18,13 @@ import logging
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 
+# Conditional import for the orjson encoder (C-accelerated, optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class JSONOutput:
     """
@@ -35,6 +42,11 @@ class JSONOutput:
             'sort_keys': True,
             'default': self._json_serializer
         }
+        # orjson equivalent of json_config; datetimes are passed through to
+        # _json_serializer so both encoders emit the same timestamp format
+        self.orjson_options = (
+            orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        ) if ORJSON_AVAILABLE else 0
     
     def _json_serializer(self, obj: Any) -> str:
         """
@@ -53,6 +65,21 @@ class JSONOutput:
             return obj.isoformat() + 'Z'  # ISO format with UTC indicator
         raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
     
+    def _write_json(self, payload: Any, filename: str) -> None:
+        """
+        Write a JSON payload to disk, using orjson when it is installed.
+        
+        Args:
+            payload: JSON-serializable payload
+            filename: Output filename
+        """
+        if ORJSON_AVAILABLE:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(payload, default=self._json_serializer, option=self.orjson_options))
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, **self.json_config)
+    
     def _enrich_post_metadata(self, post: Dict[str, Any]) -> Dict[str, Any]:
         """
         Enrich a post with additional metadata for enhanced downstream processing.
@@ -239,8 +266,7 @@ class JSONOutput:
         
         # Write to file
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(json_payload, f, **self.json_config)
+            self._write_json(json_payload, filename)
             
             logging.info(f"Successfully exported {len(enriched_posts)} posts to {filename}")
             logging.info(f"JSON validation status: {validation_report['status']}")
@@ -268,8 +294,7 @@ class JSONOutput:
             The filename of the exported JSON file
         """
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(posts, f, **self.json_config)
+            self._write_json(posts, filename)
             
             logging.info(f"Successfully exported {len(posts)} posts to {filename} (simple format)")
             return filename
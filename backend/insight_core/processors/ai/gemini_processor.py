@@ -6,10 +6,14 @@ Enhanced version with token counting capabilities
 Processes unified post structure and returns markdown summary with token usage
 """
 
+import asyncio
+import hashlib
 import os
 import json
 import logging
+import threading
 import time
+from collections import OrderedDict
 from typing import Dict, Any, Optional, List, Tuple
 from google import genai
 from google.genai import types
@@ -26,11 +30,23 @@ class GeminiProcessor:
     - Robust error handling
     """
     
+    # Maximum number of memoized count_tokens results kept (least recently used evicted first)
+    TOKEN_CACHE_MAXSIZE = 4096
+    
+    # Batch job states after which polling stops
+    BATCH_COMPLETED_STATES = frozenset({
+        'JOB_STATE_SUCCEEDED', 'JOB_STATE_FAILED', 'JOB_STATE_CANCELLED', 'JOB_STATE_EXPIRED'
+    })
+    
     def __init__(self):
         """Initialize Gemini processor"""
         self.client = None
         self.model = "gemini-2.0-flash"  # Updated to 2.0-flash for token counting
         self.is_connected = False
+        # count_tokens results keyed by sha256(model + content), in LRU order; repeated prompts skip the API call
+        self._token_count_cache: "OrderedDict[str, Any]" = OrderedDict()
+        # count_tokens may run in worker threads (see daily_briefing_with_tokens)
+        self._token_cache_lock = threading.Lock()
         
     def setup_processor(self) -> bool:
         """
@@ -68,8 +84,10 @@ class GeminiProcessor:
             # Test connection with a simple request
             test_prompt = "Hello"
             
-            # Quick test to validate connection
-            response = self.client.models.generate_content(
+            # Quick test to validate connection; the client is synchronous, so run
+            # it in a worker thread to let other connections proceed meanwhile
+            response = await asyncio.to_thread(
+                self.client.models.generate_content,
                 model=self.model,
                 contents=test_prompt,
                 config=types.GenerateContentConfig(
@@ -92,17 +110,34 @@ class GeminiProcessor:
             logging.error("Processor not connected. Call connect() first")
             return 0
         
+        cache_key = hashlib.sha256(f"{self.model}\0{content}".encode('utf-8')).hexdigest()
+        with self._token_cache_lock:
+            cached = self._token_count_cache.get(cache_key)
+            if cached is not None:
+                self._token_count_cache.move_to_end(cache_key)
+                return cached
+        
         try:
             total_tokens = self.client.models.count_tokens(
                 model=self.model, 
                 contents=content
             )
             # Removed: time.sleep(10)  # This was causing performance issues
+            with self._token_cache_lock:
+                self._token_count_cache[cache_key] = total_tokens
+                self._token_count_cache.move_to_end(cache_key)
+                if len(self._token_count_cache) > self.TOKEN_CACHE_MAXSIZE:
+                    self._token_count_cache.popitem(last=False)
             return total_tokens
         except Exception as e:
             logging.error(f"Failed to count tokens: {e}")
             return 0
 
+    def clear_token_cache(self):
+        """Forget all memoized count_tokens results"""
+        with self._token_cache_lock:
+            self._token_count_cache.clear()
+
     async def analyze_single_post_with_tokens(self, post: Dict[str, Any]) -> Dict[str, Any]:
         """
         Analyze a single post and return JSON summary with token usage
@@ -303,24 +338,15 @@ Answer the question now:
             logging.error(f"Failed to analyze post: {e}")
             return {"error": f"Analysis failed: {str(e)}"}
 
-    async def daily_briefing_with_tokens(self, posts: List[Dict[str, Any]]) -> Dict[str, Any]:
+    @staticmethod
+    def _daily_briefing_prompt(posts: List[Dict[str, Any]]) -> str:
         """
-        Generate a daily briefing for a list of posts with token tracking
-
-        Args:
-            posts: List of unified post structures
-            
-        Returns:
-            Dict with briefing content and token usage information
-        """
-        if not self.is_connected:
-            return {"error": "Processor not connected. Call connect() first"}
+        Build the daily briefing prompt for a list of posts
         
-        if not isinstance(posts, list):
-            return {"error": "Invalid posts format. Expected list"}
-        
-        try:
-            prompt = f"""
+        The static instructions come first and the posts last, so consecutive
+        briefings share an identical prefix that Gemini's implicit caching can reuse.
+        """
+        return f"""
 You are Insight — Tony Stark's senior intelligence companion. Deliver a complete, self-sufficient briefing so Stark can act without opening the sources.
 
 Directive
@@ -351,11 +377,72 @@ Intelligence Package
 {posts}
 """
 
-            # Count input tokens
-            input_tokens = self.count_tokens(prompt)
+    @staticmethod
+    def _briefing_result(response: Any, input_tokens: Any) -> Dict[str, Any]:
+        """
+        Build the daily briefing result from a Gemini response
+        
+        Args:
+            response: generate_content response (interactive or from a batch job)
+            input_tokens: Pre-counted prompt tokens, or 0 when not counted
+            
+        Returns:
+            Dict with the cleaned briefing text and token usage information
+        """
+        # Get token usage metadata
+        usage_metadata = response.usage_metadata if hasattr(response, 'usage_metadata') else None
+        
+        # Clean response text
+        briefing = response.text.strip()
+        
+        # Remove any code block formatting if present
+        if briefing.startswith('```'):
+            briefing = briefing.split('\n', 1)[1] if '\n' in briefing else briefing[3:]
+        if briefing.endswith('```'):
+            briefing = briefing.rsplit('\n', 1)[0] if '\n' in briefing else briefing[:-3]
+        
+        # Prepare token information
+        token_info = {
+            "input_tokens_counted": input_tokens,
+            "prompt_tokens": usage_metadata.prompt_token_count if usage_metadata else None,
+            "response_tokens": usage_metadata.candidates_token_count if usage_metadata else None,
+            "total_tokens": usage_metadata.total_token_count if usage_metadata else None,
+            "cached_tokens": usage_metadata.cached_content_token_count if usage_metadata else None
+        }
+        
+        return {
+            "briefing": briefing.strip(),
+            "token_usage": token_info
+        }
+
+    async def daily_briefing_with_tokens(self, posts: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Generate a daily briefing for a list of posts with token tracking
+
+        Args:
+            posts: List of unified post structures
+            
+        Returns:
+            Dict with briefing content and token usage information
+        """
+        if not self.is_connected:
+            return {"error": "Processor not connected. Call connect() first"}
+        
+        if not isinstance(posts, list):
+            return {"error": "Invalid posts format. Expected list"}
+        
+        try:
+            prompt = self._daily_briefing_prompt(posts)
+
+            # The client is synchronous; its calls run in worker threads so
+            # concurrent briefings (e.g. one per day) actually overlap
+
+            # Count input tokens (memoized by prompt hash)
+            input_tokens = await asyncio.to_thread(self.count_tokens, prompt)
 
             # Generate content with non-streaming for token metadata
-            response = self.client.models.generate_content(
+            response = await asyncio.to_thread(
+                self.client.models.generate_content,
                 model=self.model,
                 contents=prompt,
                 config=types.GenerateContentConfig(
@@ -364,34 +451,89 @@ Intelligence Package
                 )
             )
             
-            # Get token usage metadata
-            usage_metadata = response.usage_metadata if hasattr(response, 'usage_metadata') else None
+            return self._briefing_result(response, input_tokens)
             
-            # Clean response text
-            briefing = response.text.strip()
+        except Exception as e:
+            logging.error(f"Failed to analyze post: {e}")
+            return {"error": f"Analysis failed: {str(e)}"}
+
+    async def daily_briefing_batch(self, posts_by_key: Dict[Any, List[Dict[str, Any]]], poll_interval: float = 30.0, timeout: float = 3600.0) -> Dict[Any, Dict[str, Any]]:
+        """
+        Generate several daily briefings in a single Gemini Batch API job
+        
+        Batch jobs are billed at half the interactive token rate but complete
+        asynchronously (usually within minutes, at most 24 hours), so this polls
+        the job until it finishes or the timeout expires, in which case the job
+        is cancelled.
+
+        Args:
+            posts_by_key: Lists of unified post structures keyed by e.g. day; keys are returned unchanged
+            poll_interval: Seconds between job status checks
+            timeout: Seconds to wait for the job before cancelling it
             
-            # Remove any code block formatting if present
-            if briefing.startswith('```'):
-                briefing = briefing.split('\n', 1)[1] if '\n' in briefing else briefing[3:]
-            if briefing.endswith('```'):
-                briefing = briefing.rsplit('\n', 1)[0] if '\n' in briefing else briefing[:-3]
+        Returns:
+            Dict mapping each key to the same structure daily_briefing_with_tokens returns
+        """
+        keys = list(posts_by_key)
+        
+        if not self.is_connected:
+            return {key: {"error": "Processor not connected. Call connect() first"} for key in keys}
+        
+        if not keys:
+            return {}
+        
+        try:
+            # Inline requests keep submission order, so responses map back to keys by position
+            inlined_requests = [
+                {
+                    'contents': [{'parts': [{'text': self._daily_briefing_prompt(posts_by_key[key])}], 'role': 'user'}],
+                    'config': {'response_mime_type': 'text/plain', 'temperature': 0.1}
+                }
+                for key in keys
+            ]
             
-            # Prepare token information
-            token_info = {
-                "input_tokens_counted": input_tokens,
-                "prompt_tokens": usage_metadata.prompt_token_count if usage_metadata else None,
-                "response_tokens": usage_metadata.candidates_token_count if usage_metadata else None,
-                "total_tokens": usage_metadata.total_token_count if usage_metadata else None
-            }
+            # The client is synchronous; keep its HTTP calls off the event loop
+            batch_job = await asyncio.to_thread(
+                self.client.batches.create,
+                model=self.model,
+                src=inlined_requests,
+                config={'display_name': f"insight-daily-briefings-{int(time.time())}"}
+            )
+            logging.info(f"Submitted Gemini batch job {batch_job.name} with {len(keys)} briefings")
+            
+            deadline = time.monotonic() + timeout
+            while batch_job.state.name not in self.BATCH_COMPLETED_STATES:
+                if time.monotonic() >= deadline:
+                    await asyncio.to_thread(self.client.batches.cancel, name=batch_job.name)
+                    error = f"Batch job {batch_job.name} did not finish within {timeout:.0f}s and was cancelled"
+                    logging.error(error)
+                    return {key: {"error": error} for key in keys}
+                
+                await asyncio.sleep(min(poll_interval, max(deadline - time.monotonic(), 0)))
+                batch_job = await asyncio.to_thread(self.client.batches.get, name=batch_job.name)
+            
+            if batch_job.state.name != 'JOB_STATE_SUCCEEDED':
+                error = f"Batch job {batch_job.name} ended in state {batch_job.state.name}"
+                logging.error(error)
+                return {key: {"error": error} for key in keys}
+            
+            results = {}
+            for key, inlined_response in zip(keys, batch_job.dest.inlined_responses or []):
+                if inlined_response.error or not inlined_response.response:
+                    results[key] = {"error": f"Batch briefing failed: {inlined_response.error}"}
+                    continue
+                
+                # Batch requests are not pre-counted
+                results[key] = self._briefing_result(inlined_response.response, 0)
             
-            return {
-                "briefing": briefing.strip(),
-                "token_usage": token_info
-            }
+            for key in keys:
+                results.setdefault(key, {"error": "Batch briefing failed: no response returned"})
+            
+            return results
             
         except Exception as e:
-            logging.error(f"Failed to analyze post: {e}")
-            return {"error": f"Analysis failed: {str(e)}"}
+            logging.error(f"Failed to generate batch briefings: {e}")
+            return {key: {"error": f"Batch briefing failed: {str(e)}"} for key in keys}
 
     # Keep the original methods for backward compatibility
     async def analyze_single_post(self, post: Dict[str, Any]) -> Dict[str, str]: